@@ -0,0 +1,39 @@
+"""Add composite indexes for pricing lookups
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Standard length checks filter on material code and length together
+    op.create_index(
+        'ix_standard_lengths_material_code_length',
+        'standard_lengths',
+        ['material_code', 'length'],
+        unique=False
+    )
+
+    # Availability checks filter on material code, product type and availability
+    op.create_index(
+        'ix_material_availability_code_type_available',
+        'material_availability',
+        ['material_code', 'product_type', 'is_available'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_material_availability_code_type_available', table_name='material_availability')
+    op.drop_index('ix_standard_lengths_material_code_length', table_name='standard_lengths')
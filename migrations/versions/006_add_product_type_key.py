@@ -0,0 +1,59 @@
+"""Add product type key to products
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def _product_type(model_number):
+    """
+    Parse the product type from a model number, as the Product model did at
+    this revision: the part before the first "-", keeping one "/" suffix for
+    dual point switches (e.g. "LS7000/2-115VAC-H-10" -> "LS7000/2").
+    """
+    if not model_number:
+        return None
+    product_type = model_number.split('-')[0]
+    if '/' in product_type:
+        product_type = product_type.split('/')[0] + '/' + product_type.split('/')[1]
+    return product_type
+
+
+def upgrade():
+    # Product type parsed from the model number, used for material availability checks
+    op.add_column('products', sa.Column('product_type_key', sa.String(), nullable=True))
+    op.create_index(op.f('ix_products_product_type_key'), 'products', ['product_type_key'], unique=False)
+
+    # Backfill existing products with _product_type, the parsing the model's insert and
+    # update listeners use, in Python so it runs on any database
+    products = sa.table(
+        'products',
+        sa.column('id', sa.Integer),
+        sa.column('model_number', sa.String),
+        sa.column('product_type_key', sa.String),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(products.c.id, products.c.model_number)).all()
+    if rows:
+        bind.execute(
+            products.update()
+            .where(products.c.id == sa.bindparam('pid'))
+            .values(product_type_key=sa.bindparam('key')),
+            [{'pid': product_id, 'key': _product_type(model_number)} for product_id, model_number in rows]
+        )
+
+
+def downgrade():
+    op.drop_index(op.f('ix_products_product_type_key'), table_name='products')
+    op.drop_column('products', 'product_type_key')
@@ -0,0 +1,60 @@
+"""Add option product families association table
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create option_product_families table
+    op.create_table(
+        'option_product_families',
+        sa.Column('option_id', sa.Integer(), nullable=False),
+        sa.Column('product_family', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['option_id'], ['options.id'], ),
+        sa.PrimaryKeyConstraint('option_id', 'product_family')
+    )
+    
+    # Compatibility lookups go from product family to options
+    op.create_index(
+        'ix_option_product_families_family_option',
+        'option_product_families',
+        ['product_family', 'option_id'],
+        unique=False
+    )
+
+    # Backfill from the comma-separated options.product_families column
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT id, product_families FROM options WHERE product_families IS NOT NULL")
+    ).fetchall()
+    families = {
+        (option_id, family.strip())
+        for option_id, product_families in rows
+        for family in product_families.split(',')
+        if family.strip()
+    }
+    if families:
+        connection.execute(
+            sa.text(
+                "INSERT INTO option_product_families (option_id, product_family) "
+                "VALUES (:option_id, :product_family)"
+            ),
+            [{'option_id': option_id, 'product_family': family} for option_id, family in sorted(families)]
+        )
+
+
+def downgrade():
+    op.drop_index('ix_option_product_families_family_option', table_name='option_product_families')
+    op.drop_table('option_product_families')
@@ -0,0 +1,37 @@
+"""Constrain option price type to the supported values
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Options without a price type, or with an unknown one, were priced as fixed
+    op.execute("""
+        UPDATE options SET price_type = 'fixed'
+        WHERE price_type IS NULL OR price_type NOT IN ('fixed', 'per_inch', 'per_foot')
+    """)
+
+    # SQLite cannot add constraints in place, so the table is rebuilt
+    with op.batch_alter_table('options') as batch_op:
+        batch_op.alter_column('price_type', existing_type=sa.String(), nullable=False)
+        batch_op.create_check_constraint(
+            'price_type_enum', "price_type IN ('fixed', 'per_inch', 'per_foot')"
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('options') as batch_op:
+        batch_op.drop_constraint('price_type_enum', type_='check')
+        batch_op.alter_column('price_type', existing_type=sa.String(), nullable=True)
@@ -0,0 +1,30 @@
+"""Add composite index for S material sibling lookups
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Exotic material pricing looks up the S material sibling by model, voltage and material
+    op.create_index(
+        'ix_products_model_number_voltage_material',
+        'products',
+        ['model_number', 'voltage', 'material'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_products_model_number_voltage_material', table_name='products')
@@ -0,0 +1,71 @@
+"""Add full-text search indexes for customers and products
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+# FTS table -> (source table, indexed columns)
+SEARCH_INDEXES = {
+    'customer_fts': ('customers', ('name', 'company', 'email')),
+    'product_fts': ('products', ('model_number', 'description')),
+}
+
+
+def _fts_trigram_supported(bind):
+    """FTS5 trigram tables need SQLite 3.34 or newer built with FTS5."""
+    if bind.dialect.name != 'sqlite':
+        return False
+    version = bind.exec_driver_sql('SELECT sqlite_version()').scalar()
+    if tuple(int(part) for part in version.split('.')[:3]) < (3, 34, 0):
+        return False
+    options = {row[0] for row in bind.exec_driver_sql('PRAGMA compile_options')}
+    return 'ENABLE_FTS5' in options
+
+
+def upgrade():
+    # Trigram FTS5 tables serve substring searches from an index instead of a
+    # LIKE scan; without trigram support searches keep using ILIKE
+    if not _fts_trigram_supported(op.get_bind()):
+        return
+    for fts_name, (table_name, columns) in SEARCH_INDEXES.items():
+        cols = ', '.join(columns)
+        new_cols = ', '.join(f'new.{c}' for c in columns)
+        old_cols = ', '.join(f'old.{c}' for c in columns)
+        delete_row = (
+            f"INSERT INTO {fts_name}({fts_name}, rowid, {cols}) "
+            f"VALUES ('delete', old.id, {old_cols});"
+        )
+        insert_row = f"INSERT INTO {fts_name}(rowid, {cols}) VALUES (new.id, {new_cols});"
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts_name} USING fts5("
+            f"{cols}, content='{table_name}', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(f"CREATE TRIGGER {fts_name}_ai AFTER INSERT ON {table_name} BEGIN {insert_row} END")
+        op.execute(f"CREATE TRIGGER {fts_name}_ad AFTER DELETE ON {table_name} BEGIN {delete_row} END")
+        op.execute(
+            f"CREATE TRIGGER {fts_name}_au AFTER UPDATE ON {table_name} "
+            f"BEGIN {delete_row} {insert_row} END"
+        )
+        # Index the rows that already exist
+        op.execute(f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for fts_name in SEARCH_INDEXES:
+        for suffix in ('ai', 'ad', 'au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts_name}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts_name}")
@@ -0,0 +1,55 @@
+"""Add composite indexes for family option lookups and catalog filters
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Voltage and material lookups filter on product family and availability together
+    op.create_index(
+        'ix_voltage_options_family_available',
+        'voltage_options',
+        ['product_family', 'is_available'],
+        unique=False
+    )
+    op.create_index(
+        'ix_material_options_family_available',
+        'material_options',
+        ['product_family', 'is_available'],
+        unique=False
+    )
+
+    # Catalog filters match on material and voltage
+    op.create_index(
+        'ix_products_material_voltage',
+        'products',
+        ['material', 'voltage'],
+        unique=False
+    )
+
+    # Variant lookups filter on family, then voltage and material
+    op.create_index(
+        'ix_product_variants_family_voltage_material',
+        'product_variants',
+        ['product_family_id', 'voltage', 'material'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_product_variants_family_voltage_material', table_name='product_variants')
+    op.drop_index('ix_products_material_voltage', table_name='products')
+    op.drop_index('ix_material_options_family_available', table_name='material_options')
+    op.drop_index('ix_voltage_options_family_available', table_name='voltage_options')
@@ -0,0 +1,51 @@
+"""Add option excluded products association table
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create option_excluded_products table; the primary key serves exclusion checks
+    op.create_table(
+        'option_excluded_products',
+        sa.Column('option_id', sa.Integer(), nullable=False),
+        sa.Column('model_number', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['option_id'], ['options.id'], ),
+        sa.PrimaryKeyConstraint('option_id', 'model_number')
+    )
+
+    # Backfill from the comma-separated options.excluded_products column
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT id, excluded_products FROM options WHERE excluded_products IS NOT NULL")
+    ).fetchall()
+    exclusions = {
+        (option_id, model_number.strip())
+        for option_id, excluded_products in rows
+        for model_number in excluded_products.split(',')
+        if model_number.strip()
+    }
+    if exclusions:
+        connection.execute(
+            sa.text(
+                "INSERT INTO option_excluded_products (option_id, model_number) "
+                "VALUES (:option_id, :model_number)"
+            ),
+            [{'option_id': option_id, 'model_number': model_number} for option_id, model_number in sorted(exclusions)]
+        )
+
+
+def downgrade():
+    op.drop_table('option_excluded_products')
@@ -0,0 +1,57 @@
+"""Replace option availability indexes with partial indexes on available rows
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Lookups only read available rows, so index just those rows
+    op.drop_index('ix_voltage_options_family_available', table_name='voltage_options')
+    op.create_index(
+        'ix_voltage_options_available_family',
+        'voltage_options',
+        ['product_family', 'voltage'],
+        unique=False,
+        sqlite_where=sa.text('is_available = 1'),
+        postgresql_where=sa.text('is_available = 1')
+    )
+
+    op.drop_index('ix_material_options_family_available', table_name='material_options')
+    op.create_index(
+        'ix_material_options_available_family',
+        'material_options',
+        ['product_family'],
+        unique=False,
+        sqlite_where=sa.text('is_available = 1'),
+        postgresql_where=sa.text('is_available = 1')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_material_options_available_family', table_name='material_options')
+    op.create_index(
+        'ix_material_options_family_available',
+        'material_options',
+        ['product_family', 'is_available'],
+        unique=False
+    )
+
+    op.drop_index('ix_voltage_options_available_family', table_name='voltage_options')
+    op.create_index(
+        'ix_voltage_options_family_available',
+        'voltage_options',
+        ['product_family', 'is_available'],
+        unique=False
+    )
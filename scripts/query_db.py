@@ -96,17 +96,19 @@ def print_product_families(db):
 def print_product_variants(db):
     """Print product variants in the database."""
     print_separator("Product Variants")
-    variants = db.query(ProductVariant).all()
-    
-    if not variants:
-        print("No product variants found.")
-        return
-    
-    print(f"{'Model':<25} {'Material':<10} {'Voltage':<10} {'Base Length':<12} {'Base Price'}")
-    print("-" * 80)
+    # Stream the variants in chunks rather than loading them all up front
+    variants = db.query(ProductVariant).yield_per(100)
     
+    count = 0
     for variant in variants:
+        if count == 0:
+            print(f"{'Model':<25} {'Material':<10} {'Voltage':<10} {'Base Length':<12} {'Base Price'}")
+            print("-" * 80)
         print(f"{variant.model_number:<25} {variant.material:<10} {variant.voltage:<10} {variant.base_length:<12} ${variant.base_price:.2f}")
+        count += 1
+    
+    if count == 0:
+        print("No product variants found.")
 
 
 def print_options(db):
@@ -134,17 +136,18 @@ def print_options(db):
 def print_customers(db):
     """Print all customers in the database."""
     print_separator("Customers")
-    customers = db.query(Customer).all()
-    
-    if not customers:
-        print("No customers found.")
-        return
-    
-    print(f"{'Name':<20} {'Company':<25} {'Email':<30} {'Phone'}")
-    print("-" * 80)
+    customers = db.query(Customer).yield_per(200)
     
+    count = 0
     for customer in customers:
+        if count == 0:
+            print(f"{'Name':<20} {'Company':<25} {'Email':<30} {'Phone'}")
+            print("-" * 80)
         print(f"{customer.name:<20} {customer.company or 'N/A':<25} {customer.email or 'N/A':<30} {customer.phone or 'N/A'}")
+        count += 1
+    
+    if count == 0:
+        print("No customers found.")
 
 
 def print_material_availability(db):
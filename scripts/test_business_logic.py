@@ -9,7 +9,6 @@ from sqlalchemy.orm import Session
 from src.core.database import SessionLocal
 from src.core.models import Option
 from src.core.services import QuoteService, CustomerService, ProductService
-from src.utils.db_utils import get_by_id
 
 
 def test_customer_service():
@@ -192,14 +191,15 @@ def test_quote_service():
         print(f"Updated quote status: {updated_quote.status}")
         
         # Get fresh quote data to see totals
-        db.refresh(quote)
+        db.expire_all()
+        quote = QuoteService.get_quote(db, quote.id)
         print(f"\nQuote total: ${quote.total:.2f}")
         print(f"Quote items: {len(quote.items)}")
         for item in quote.items:
             print(f"  - {item.description}: {item.quantity} x ${item.unit_price:.2f} = ${item.total:.2f}")
             if item.options:
                 for option_item in item.options:
-                    option = get_by_id(db, Option, option_item.option_id)
+                    option = option_item.option
                     print(f"    + {option.name}: {option_item.quantity} x ${option_item.price:.2f}")
                     
     finally:
@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 
 from src.core.database import SessionLocal
 from src.core.models import Product, Material
-from src.core.pricing import calculate_product_price, calculate_option_price
+from src.core.pricing import calculate_product_prices, calculate_option_price
 
 
 def test_product_pricing(db: Session):
@@ -33,37 +33,50 @@ def test_product_pricing(db: Session):
         ("FS10000", "Flow Switch")
     ]
     
+    # Test with different materials
+    materials = [
+        ("H", "Hastelloy"),
+        ("A", "Aluminum"),
+        ("T", "Titanium"),
+        ("U", "Monel")
+    ]
+    
+    # Get product with standard configuration (S material) for each model
+    products = []
     for model_number, description in test_models:
-        # Get product with standard configuration (S material)
         product = db.query(Product).filter(
             Product.model_number.startswith(model_number),
             Product.material == "S"
         ).first()
-        
+        products.append((model_number, description, product))
+    
+    # Price every configuration in a single batched query: the extended
+    # length first, then each material override
+    requests = []
+    for _, _, product in products:
+        if product:
+            requests.append((product.id, product.base_length + 10, None))
+            requests.extend((product.id, None, material_code) for material_code, _ in materials)
+    prices = iter(calculate_product_prices(db, requests))
+    
+    for model_number, description, product in products:
         if product:
             print(f"\nTesting {model_number} - {description}")
             print(f"Base configuration (S material, {product.base_length}\"): ${product.base_price:.2f}")
             
             # Test with longer length
             longer_length = product.base_length + 10
-            price = calculate_product_price(db, product.id, longer_length)
-            print(f"Extended length ({longer_length}\"): ${price:.2f}")
-            
-            # Test with different materials
-            materials = [
-                ("H", "Hastelloy"),
-                ("A", "Aluminum"),
-                ("T", "Titanium"),
-                ("U", "Monel")
-            ]
+            price = next(prices)
+            if price is not None:
+                print(f"Extended length ({longer_length}\"): ${price:.2f}")
+            else:
+                print(f"Extended length ({longer_length}\"): Not available")
             
             for material_code, material_name in materials:
-                try:
-                    price = calculate_product_price(
-                        db, product.id, material_override=material_code
-                    )
+                price = next(prices)
+                if price is not None:
                     print(f"{material_name} material: ${price:.2f}")
-                except ValueError as e:
+                else:
                     print(f"{material_name} material: Not available")
         else:
             print(f"\nWarning: {model_number} not found in database")
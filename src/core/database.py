@@ -8,6 +8,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from src.core.search import create_search_indexes
+
 # Ensure data directory exists
 DATA_DIR = Path("data")
 if not DATA_DIR.exists():
@@ -33,4 +35,5 @@ def get_db():
 
 def init_db():
     """Initialize database, creating tables if they don't exist"""
-    Base.metadata.create_all(bind=engine) 
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+    create_search_indexes(engine) 
\ No newline at end of file
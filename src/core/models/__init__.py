@@ -5,7 +5,7 @@ from src.core.models.customer import Customer
 from src.core.models.product import Product
 from src.core.models.product_variant import ProductFamily, ProductVariant
 from src.core.models.material import Material, StandardLength, MaterialAvailability
-from src.core.models.option import Option, QuoteItemOption
+from src.core.models.option import Option, OptionProductFamily, OptionExcludedProduct, QuoteItemOption
 from src.core.models.quote import Quote, QuoteItem
 from src.core.models.spare_part import SparePart
 from src.core.models.connection_option import ConnectionOption
@@ -21,6 +21,8 @@ __all__ = [
     "StandardLength",
     "MaterialAvailability",
     "Option",
+    "OptionProductFamily",
+    "OptionExcludedProduct",
     "QuoteItemOption",
     "Quote",
     "QuoteItem",
@@ -12,6 +12,7 @@ from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.core.database import Base
+from src.core.search import register_search_index
 
 
 class Customer(Base):
@@ -61,4 +62,8 @@ class Customer(Base):
         Returns:
             str: A string showing the customer ID, name, and company
         """
-        return f"<Customer(id={self.id}, name='{self.name}', company='{self.company}')>" 
\ No newline at end of file
+        return f"<Customer(id={self.id}, name='{self.name}', company='{self.company}')>"
+
+
+# Full-text index for customer search
+register_search_index(Customer.__table__, "customer_fts", ("name", "company", "email"))
@@ -12,7 +12,7 @@ Supports:
 - Standard vs. non-standard length logic
 - Material compatibility with product types
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from src.core.database import Base
@@ -91,6 +91,10 @@ class StandardLength(Base):
     """
     
     __tablename__ = "standard_lengths"
+    __table_args__ = (
+        # Standard length checks match on material and length together
+        Index("ix_standard_lengths_material_code_length", "material_code", "length"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     material_code = Column(String, nullable=False, index=True)
@@ -125,6 +129,13 @@ class MaterialAvailability(Base):
     """
     
     __tablename__ = "material_availability"
+    __table_args__ = (
+        # Availability checks match on material, product type and availability together
+        Index(
+            "ix_material_availability_code_type_available",
+            "material_code", "product_type", "is_available"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     material_code = Column(String, ForeignKey("materials.code"), nullable=False, index=True)
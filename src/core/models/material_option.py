@@ -9,7 +9,7 @@ Supports:
 - Material compatibility and filtering for products
 - Material-specific pricing adders
 """
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Integer, String, Float, Index, text
 from src.core.database import Base
 
 class MaterialOption(Base):
@@ -33,6 +33,16 @@ class MaterialOption(Base):
     """
     
     __tablename__ = "material_options"
+    __table_args__ = (
+        # Material lookups only read available rows of a product family; the
+        # partial index holds just those rows
+        Index(
+            "ix_material_options_available_family",
+            "product_family",
+            sqlite_where=text("is_available = 1"),
+            postgresql_where=text("is_available = 1")
+        ),
+    )
     
     id = Column(Integer, primary_key=True)
     product_family = Column(String, nullable=False)  # e.g., "LS2000", "LS6000"
@@ -4,6 +4,8 @@ Option model for storing product add-ons and their pricing.
 This module defines models for product options (add-ons) and their association
 with quote line items. It includes:
 - Option: Represents a configurable add-on or feature for a product
+- OptionProductFamily: Association table of the product families an option is compatible with
+- OptionExcludedProduct: Association table of the products an option is incompatible with
 - QuoteItemOption: Junction table for tracking which options are added to which quote items
 
 These models support:
@@ -12,19 +14,49 @@ These models support:
 - Exclusion of incompatible products
 - Tracking option selections in quotes
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from typing import List, Optional
+
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, ForeignKey, Index, CheckConstraint
+from sqlalchemy.orm import reconstructor, relationship, validates
 
 from src.core.database import Base
 
 
+def _fixed_price(price: float, length: Optional[float]) -> float:
+    """Price of a fixed price option."""
+    return price
+
+
+def _per_inch_price(price: float, length: Optional[float]) -> float:
+    """Price of a per-inch option; fixed when there is no length."""
+    return price * length if length is not None else price
+
+
+def _per_foot_price(price: float, length: Optional[float]) -> float:
+    """Price of a per-foot option (length in inches); fixed when there is no length."""
+    return price * (length / 12) if length is not None else price
+
+
+# Pricing function for each price type
+OPTION_PRICE_FUNCTIONS = {
+    "fixed": _fixed_price,
+    "per_inch": _per_inch_price,
+    "per_foot": _per_foot_price,
+}
+
+# Price types an option may have, in storage order
+OPTION_PRICE_TYPES = tuple(OPTION_PRICE_FUNCTIONS)
+
+
 class Option(Base):
     """
     SQLAlchemy model representing a configurable product option (add-on).
     
     Stores information about an option, including its name, description, pricing,
     category, and compatibility rules. Options can be priced as fixed, per-inch,
-    or per-foot, and can be included or excluded for specific products.
+    or per-foot, and can be included or excluded for specific products. The
+    pricing function for the option's price type is resolved once, when the
+    option is loaded or its price type is set, rather than on every price.
     
     Attributes:
         id (int): Primary key
@@ -34,14 +66,30 @@ class Option(Base):
         price_type (str): Pricing type ("fixed", "per_inch", "per_foot")
         category (str): Option category (e.g., "mounting", "feature")
         product_families (str): Comma-separated compatible product families
+                               (setting it also sets families)
         excluded_products (str): Comma-separated incompatible products
+                                (setting it also sets exclusions)
+        families (List[OptionProductFamily]): Compatible product families, one row
+                                             each; no rows means all families
+        exclusions (List[OptionExcludedProduct]): Incompatible product model numbers,
+                                                 one row each
     
     Example:
         >>> option = Option(name="Explosion Proof Housing", price=250.0, price_type="fixed")
         >>> print(option)
+        >>> Option(name="Extra Cable", price=10.0, price_type="per_inch").calculate_price(24)
+        240.0
     """
     
     __tablename__ = "options"
+    __table_args__ = (
+        # A plain string column with a CHECK rather than an Enum type, so rows
+        # written before the constraint existed still load and price as fixed
+        CheckConstraint(
+            "price_type IN (" + ", ".join(f"'{t}'" for t in OPTION_PRICE_TYPES) + ")",
+            name="price_type_enum",
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -49,7 +97,7 @@ class Option(Base):
     
     # Pricing information
     price = Column(Float, nullable=False, default=0.0)
-    price_type = Column(String, default="fixed")  # "fixed", "per_inch", "per_foot"
+    price_type = Column(String, nullable=False, default="fixed")  # "fixed", "per_inch", "per_foot"
     
     # Option category
     category = Column(String, index=True)  # e.g., "mounting", "material", "feature"
@@ -58,6 +106,72 @@ class Option(Base):
     product_families = Column(String)  # Comma-separated list of compatible product families
     excluded_products = Column(String)  # Comma-separated list of incompatible products
     
+    # Relationships
+    families = relationship(
+        "OptionProductFamily", back_populates="option", cascade="all, delete-orphan", lazy="selectin"
+    )
+    exclusions = relationship(
+        "OptionExcludedProduct", back_populates="option", cascade="all, delete-orphan", lazy="selectin"
+    )
+    
+    # Until a price type is set, options are priced as fixed (the column default)
+    _price_fn = staticmethod(_fixed_price)
+    
+    @reconstructor
+    def _init_price_fn(self):
+        """
+        Resolve the pricing function when the option is loaded from the database.
+        
+        A missing or unknown price type, as in databases not yet migrated to
+        the price type constraint, is priced as fixed like calculate_option_price.
+        """
+        self._price_fn = OPTION_PRICE_FUNCTIONS.get(self.price_type, _fixed_price)
+    
+    @validates("price_type")
+    def _validate_price_type(self, key, price_type):
+        """
+        Validate the price type and resolve its pricing function.
+        
+        Raises:
+            ValueError: If price_type is not one of OPTION_PRICE_TYPES
+        """
+        if price_type not in OPTION_PRICE_FUNCTIONS:
+            raise ValueError(f"Invalid price type: {price_type}. Must be one of {list(OPTION_PRICE_TYPES)}")
+        self._price_fn = OPTION_PRICE_FUNCTIONS[price_type]
+        return price_type
+    
+    @validates("product_families")
+    def _validate_product_families(self, key, product_families):
+        """Keep the families association rows in sync with the comma-separated list."""
+        self.families = [
+            OptionProductFamily(product_family=family)
+            for family in _split_list(product_families)
+        ]
+        return product_families
+    
+    @validates("excluded_products")
+    def _validate_excluded_products(self, key, excluded_products):
+        """Keep the exclusions association rows in sync with the comma-separated list."""
+        self.exclusions = [
+            OptionExcludedProduct(model_number=model_number)
+            for model_number in _split_list(excluded_products)
+        ]
+        return excluded_products
+    
+    def calculate_price(self, length: Optional[float] = None) -> float:
+        """
+        Calculate the price of this option for a given length.
+        
+        Equivalent to pricing.calculate_option_price(self.price, self.price_type, length).
+        
+        Args:
+            length: Length in inches (used by per-inch and per-foot options)
+            
+        Returns:
+            float: Calculated option price
+        """
+        return self._price_fn(self.price, length)
+    
     def __repr__(self):
         """
         Return a string representation of the Option.
@@ -67,6 +181,88 @@ class Option(Base):
         return f"<Option(id={self.id}, name='{self.name}', price={self.price})>"
 
 
+def _split_list(values: Optional[str]) -> List[str]:
+    """Split a comma-separated list, dropping blanks and duplicates."""
+    items = []
+    for item in (values or "").split(","):
+        item = item.strip()
+        if item and item not in items:
+            items.append(item)
+    return items
+
+
+class OptionProductFamily(Base):
+    """
+    SQLAlchemy model linking an option to a compatible product family.
+    
+    Normalized form of Option.product_families, so compatibility can be checked
+    with an indexed equality instead of scanning comma-separated strings. An
+    option without any rows is compatible with every product family.
+    
+    Attributes:
+        option_id (int): Foreign key to the option
+        product_family (str): Product family (e.g., "LS2000", "LS7000/2")
+        option (Option): Related option object
+    
+    Example:
+        >>> OptionProductFamily(option_id=1, product_family="LS2000")
+    """
+    
+    __tablename__ = "option_product_families"
+    __table_args__ = (
+        # Compatibility lookups go from product family to options
+        Index("ix_option_product_families_family_option", "product_family", "option_id"),
+    )
+    
+    option_id = Column(Integer, ForeignKey("options.id"), primary_key=True)
+    product_family = Column(String, primary_key=True)
+    
+    # Relationships
+    option = relationship("Option", back_populates="families")
+    
+    def __repr__(self):
+        """
+        Return a string representation of the OptionProductFamily.
+        Returns:
+            str: A string showing the option ID and product family
+        """
+        return f"<OptionProductFamily(option_id={self.option_id}, product_family='{self.product_family}')>"
+
+
+class OptionExcludedProduct(Base):
+    """
+    SQLAlchemy model excluding an option from a product.
+    
+    Normalized form of Option.excluded_products, so exclusions are checked with
+    an indexed equality on the full model number instead of a substring search
+    of comma-separated strings (which also matched "LS2" inside "LS2000").
+    
+    Attributes:
+        option_id (int): Foreign key to the option
+        model_number (str): Model number of the incompatible product
+        option (Option): Related option object
+    
+    Example:
+        >>> OptionExcludedProduct(option_id=1, model_number="LS2000")
+    """
+    
+    __tablename__ = "option_excluded_products"
+    
+    option_id = Column(Integer, ForeignKey("options.id"), primary_key=True)
+    model_number = Column(String, primary_key=True)
+    
+    # Relationships
+    option = relationship("Option", back_populates="exclusions")
+    
+    def __repr__(self):
+        """
+        Return a string representation of the OptionExcludedProduct.
+        Returns:
+            str: A string showing the option ID and excluded model number
+        """
+        return f"<OptionExcludedProduct(option_id={self.option_id}, model_number='{self.model_number}')>"
+
+
 class QuoteItemOption(Base):
     """
     SQLAlchemy model representing an option added to a quote line item.
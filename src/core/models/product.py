@@ -13,10 +13,36 @@ The Product model supports:
 - Material and voltage options
 - Categorization and searching
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean, Text
+from typing import Optional
+
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, Index, event
 from sqlalchemy.orm import relationship
 
 from src.core.database import Base
+from src.core.search import register_search_index
+
+
+def get_product_type(model_number: Optional[str]) -> Optional[str]:
+    """
+    Extract the base product type from a model number.
+
+    Args:
+        model_number: Full model number (e.g., "LS2000-115VAC-S-10")
+
+    Returns:
+        Optional[str]: Product type (e.g., "LS2000", or "LS7000/2" for dual point
+                      switches), or None if there is no model number
+    """
+    if not model_number:
+        return None
+
+    product_type = model_number.split('-')[0]
+
+    # Special handling for dual point switches which have a format like "LS7000/2-115VAC-H-10"
+    if "/" in product_type:
+        product_type = product_type.split("/")[0] + "/" + product_type.split("/")[1]
+
+    return product_type
 
 
 class Product(Base):
@@ -40,6 +66,8 @@ class Product(Base):
                        - "H": Halar Coated
                        - "U": UHMWPE
                        - "T": Teflon
+        product_type_key (str): Product type parsed from the model number (e.g.,
+                               "LS2000", "LS7000/2"); maintained automatically
     
     Note:
         - Product variants (specific configurations) are handled by the ProductVariant model
@@ -60,9 +88,16 @@ class Product(Base):
     """
     
     __tablename__ = "products"
+    __table_args__ = (
+        # Exotic material pricing looks up the S material sibling by model, voltage and material
+        Index("ix_products_model_number_voltage_material", "model_number", "voltage", "material"),
+        # Catalog filters in ProductService.get_products match on material and voltage
+        Index("ix_products_material_voltage", "material", "voltage"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     model_number = Column(String, nullable=False, index=True)  # e.g., "LS2000", "LS8000/2"
+    product_type_key = Column(String, index=True)  # Set from model_number on insert/update
     description = Column(Text)
     category = Column(String, index=True)  # e.g., "Level Switch", "Transmitter"
     
@@ -83,4 +118,15 @@ class Product(Base):
         Returns:
             str: A string showing the product's ID, model number, and base price
         """
-        return f"<Product(id={self.id}, model='{self.model_number}', base_price={self.base_price})>"            
\ No newline at end of file
+        return f"<Product(id={self.id}, model='{self.model_number}', base_price={self.base_price})>"
+
+
+@event.listens_for(Product, "before_insert")
+@event.listens_for(Product, "before_update")
+def _set_product_type_key(mapper, connection, target: Product) -> None:
+    """Keep product_type_key in sync with the model number."""
+    target.product_type_key = get_product_type(target.model_number)
+
+
+# Full-text index for product search
+register_search_index(Product.__table__, "product_fts", ("model_number", "description"))
@@ -10,7 +10,7 @@ Supports:
 - Product variant configuration and pricing
 - Relationships to spare parts and quote items
 """
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from src.core.database import Base
@@ -82,6 +82,10 @@ class ProductVariant(Base):
     """
     
     __tablename__ = "product_variants"
+    __table_args__ = (
+        # Variant lookups filter on family, then voltage and material
+        Index("ix_product_variants_family_voltage_material", "product_family_id", "voltage", "material"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     product_family_id = Column(Integer, ForeignKey("product_families.id"), nullable=False)
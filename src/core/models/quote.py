@@ -12,10 +12,14 @@ These models support:
 - Calculation of totals, discounts, and option pricing
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text
-from sqlalchemy.orm import relationship
+from typing import Dict, Iterable
+
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text, func, select
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Session, relationship
 
 from src.core.database import Base
+from src.core.models.option import QuoteItemOption
 
 
 class Quote(Base):
@@ -24,7 +28,7 @@ class Quote(Base):
     
     Stores metadata about a quote, including the customer, creation/expiration dates,
     status, and associated line items. Provides a property to calculate the total
-    value of the quote.
+    value of the quote, and a classmethod to total many quotes in one query.
     
     Attributes:
         id (int): Primary key
@@ -54,7 +58,8 @@ class Quote(Base):
     
     # Relationships
     customer = relationship("Customer", back_populates="quotes")
-    items = relationship("QuoteItem", back_populates="quote", cascade="all, delete-orphan")
+    # Loaded with the quote (one IN query for all items) so totals don't trigger N+1 loads
+    items = relationship("QuoteItem", back_populates="quote", cascade="all, delete-orphan", lazy="selectin")
     
     def __repr__(self):
         """
@@ -73,14 +78,66 @@ class Quote(Base):
         """
         return sum(item.total for item in self.items)
 
+    @classmethod
+    def compute_totals(cls, db: Session, quote_ids: Iterable[int]) -> Dict[int, float]:
+        """
+        Calculate the totals of many quotes in a single query.
+        
+        Equivalent to reading Quote.total for each quote, but the line item,
+        option and discount arithmetic is done by the database, so no quotes,
+        items or options are loaded.
+        
+        Args:
+            db: SQLAlchemy database session
+            quote_ids: IDs of the quotes to total
+            
+        Returns:
+            Dict[int, float]: Total for each requested quote ID (0.0 for quotes
+                             without line items)
+        
+        Example:
+            >>> Quote.compute_totals(db, [1, 2])
+            {1: 1250.0, 2: 0.0}
+        """
+        quote_ids = list(quote_ids)
+        totals = dict.fromkeys(quote_ids, 0.0)
+        if not quote_ids:
+            return totals
+        
+        options_total = (
+            select(
+                QuoteItemOption.quote_item_id,
+                func.sum(QuoteItemOption.price * QuoteItemOption.quantity).label("options_total")
+            )
+            .group_by(QuoteItemOption.quote_item_id)
+            .subquery()
+        )
+        subtotal = (
+            QuoteItem.unit_price * QuoteItem.quantity
+            + func.coalesce(options_total.c.options_total, 0.0)
+        )
+        stmt = (
+            select(
+                QuoteItem.quote_id,
+                func.sum(subtotal * (1 - func.coalesce(QuoteItem.discount_percent, 0.0) / 100))
+            )
+            .outerjoin(options_total, options_total.c.quote_item_id == QuoteItem.id)
+            .where(QuoteItem.quote_id.in_(quote_ids))
+            .group_by(QuoteItem.quote_id)
+        )
+        for quote_id, total in db.execute(stmt):
+            totals[quote_id] = total
+        return totals
+
 
 class QuoteItem(Base):
     """
     SQLAlchemy model representing a line item in a quote.
     
     Each QuoteItem stores a specific product configuration, including quantity,
-    pricing, material, voltage, and any options. Provides properties for subtotal,
-    discount, and total calculations.
+    pricing, material, voltage, and any options. Provides hybrid properties for
+    subtotal, discount, and total calculations, which can also be used in queries
+    (e.g., ``db.query(QuoteItem).filter(QuoteItem.total > 1000)``).
     
     Attributes:
         id (int): Primary key
@@ -122,7 +179,8 @@ class QuoteItem(Base):
     # Relationships
     quote = relationship("Quote", back_populates="items")
     product = relationship("ProductVariant", back_populates="quote_items")
-    options = relationship("QuoteItemOption", back_populates="quote_item", cascade="all, delete-orphan")
+    # Loaded with the items (one IN query for all options) so totals don't trigger N+1 loads
+    options = relationship("QuoteItemOption", back_populates="quote_item", cascade="all, delete-orphan", lazy="selectin")
     
     def __repr__(self):
         """
@@ -132,7 +190,7 @@ class QuoteItem(Base):
         """
         return f"<QuoteItem(id={self.id}, product_id={self.product_id}, quantity={self.quantity})>"
     
-    @property
+    @hybrid_property
     def options_total(self):
         """
         Calculate the total price for all options in this line item.
@@ -145,7 +203,16 @@ class QuoteItem(Base):
         """
         return sum(option.price * option.quantity for option in self.options)
     
-    @property
+    @options_total.expression
+    def options_total(cls):
+        """SQL form of options_total: a correlated sum over the item's options."""
+        return (
+            select(func.coalesce(func.sum(QuoteItemOption.price * QuoteItemOption.quantity), 0.0))
+            .where(QuoteItemOption.quote_item_id == cls.id)
+            .scalar_subquery()
+        )
+    
+    @hybrid_property
     def subtotal(self):
         """
         Calculate the subtotal before discount.
@@ -158,7 +225,7 @@ class QuoteItem(Base):
         """
         return (self.unit_price * self.quantity) + self.options_total
     
-    @property
+    @hybrid_property
     def discount_amount(self):
         """
         Calculate the discount amount for this line item.
@@ -171,7 +238,7 @@ class QuoteItem(Base):
         """
         return self.subtotal * (self.discount_percent / 100)
     
-    @property
+    @hybrid_property
     def total(self):
         """
         Calculate the total for this line item with discount applied.
@@ -7,7 +7,7 @@ It stores which voltage configurations are available for each product family.
 Supports:
 - Voltage compatibility and filtering for products
 """
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Index, text
 from src.core.database import Base
 
 class VoltageOption(Base):
@@ -29,6 +29,17 @@ class VoltageOption(Base):
     """
     
     __tablename__ = "voltage_options"
+    __table_args__ = (
+        # Voltage lookups only read available rows of a product family; the
+        # partial index holds just those rows
+        Index(
+            "ix_voltage_options_available_family",
+            "product_family",
+            "voltage",
+            sqlite_where=text("is_available = 1"),
+            postgresql_where=text("is_available = 1")
+        ),
+    )
     
     id = Column(Integer, primary_key=True)
     product_family = Column(String, nullable=False)  # e.g., "LS2000", "LS6000"
@@ -0,0 +1,243 @@
+"""
+Full-text search indexes for the quoting system.
+
+Customer and product searches match a term anywhere inside several text
+columns. A LIKE '%term%' filter cannot use a B-tree index, so every keystroke
+in the search boxes scanned the whole table. On SQLite this module keeps an
+FTS5 table with the trigram tokenizer alongside each searchable table. The
+trigram tokenizer answers case-insensitive substring queries from an index,
+so searches keep the same semantics as the ILIKE filters they replace.
+
+The FTS tables use external content, meaning they store only the index and
+read rows from the source table. Triggers keep them in sync on insert,
+update and delete.
+
+The trigram tokenizer needs SQLite 3.34 or newer built with FTS5. On older
+or reduced builds the indexes are not created and searches fall back to
+ILIKE filters.
+"""
+import logging
+import weakref
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Table, column, event, or_, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+# The trigram tokenizer cannot match terms shorter than three characters
+MIN_FTS_TERM_LENGTH = 3
+
+# Shorter terms match too much to be useful and are not searched at all;
+# longer terms are truncated
+MIN_SEARCH_TERM_LENGTH = 2
+MAX_SEARCH_TERM_LENGTH = 64
+
+# First SQLite version with the FTS5 trigram tokenizer
+MIN_TRIGRAM_SQLITE_VERSION = (3, 34, 0)
+
+# FTS table name -> (source table name, indexed columns)
+SEARCH_INDEXES: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+
+# Engine -> FTS tables known to exist. Only tables found are remembered, so a
+# missing index is looked for again on the next search.
+_available_indexes: "weakref.WeakKeyDictionary[Engine, Set[str]]" = weakref.WeakKeyDictionary()
+
+
+def fts_trigram_supported(connection: Connection) -> bool:
+    """
+    Check whether a database can hold FTS5 trigram indexes.
+
+    Args:
+        connection: Database connection
+
+    Returns:
+        bool: True on SQLite 3.34 or newer built with FTS5
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+    version = connection.exec_driver_sql("SELECT sqlite_version()").scalar()
+    if tuple(int(part) for part in version.split(".")[:3]) < MIN_TRIGRAM_SQLITE_VERSION:
+        return False
+    options = {row[0] for row in connection.exec_driver_sql("PRAGMA compile_options")}
+    return "ENABLE_FTS5" in options
+
+
+def _search_index_ddl(fts_name: str, table_name: str, columns: Tuple[str, ...]) -> List[str]:
+    """
+    Build the statements that create an FTS table and its sync triggers.
+
+    Args:
+        fts_name: Name of the FTS5 virtual table
+        table_name: Name of the source table (rowid is its integer "id" column)
+        columns: Text columns to index
+
+    Returns:
+        List[str]: Idempotent CREATE statements
+    """
+    cols = ", ".join(columns)
+    new_cols = ", ".join(f"new.{c}" for c in columns)
+    old_cols = ", ".join(f"old.{c}" for c in columns)
+    delete_row = (
+        f"INSERT INTO {fts_name}({fts_name}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_cols});"
+    )
+    insert_row = f"INSERT INTO {fts_name}(rowid, {cols}) VALUES (new.id, {new_cols});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name} USING fts5("
+        f"{cols}, content='{table_name}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ai AFTER INSERT ON {table_name} "
+        f"BEGIN {insert_row} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ad AFTER DELETE ON {table_name} "
+        f"BEGIN {delete_row} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_au AFTER UPDATE ON {table_name} "
+        f"BEGIN {delete_row} {insert_row} END",
+    ]
+
+
+def register_search_index(table: Table, fts_name: str, columns: Tuple[str, ...]) -> None:
+    """
+    Keep an FTS5 index for a table whenever the table is created on SQLite.
+
+    Args:
+        table: Source table
+        fts_name: Name of the FTS5 virtual table
+        columns: Text columns to index
+    """
+    SEARCH_INDEXES[fts_name] = (table.name, columns)
+
+    def _create(target, connection, **kw):
+        if connection.dialect.name != "sqlite":
+            return
+        if not fts_trigram_supported(connection):
+            logger.warning("SQLite lacks FTS5 trigram support; %s not created", fts_name)
+            return
+        for statement in _search_index_ddl(fts_name, table.name, columns):
+            connection.exec_driver_sql(statement)
+
+    def _drop(target, connection, **kw):
+        if connection.dialect.name != "sqlite":
+            return
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {fts_name}")
+
+    event.listen(table, "after_create", _create)
+    event.listen(table, "before_drop", _drop)
+
+
+def create_search_indexes(engine: Engine) -> None:
+    """
+    Create any missing FTS indexes for tables that already exist.
+
+    ``metadata.create_all`` only creates the indexes along with new tables,
+    so databases created before full-text search was added are brought up to
+    date here. A newly created index is rebuilt from its source table.
+
+    Args:
+        engine: Database engine
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as connection:
+        if not fts_trigram_supported(connection):
+            logger.warning("SQLite lacks FTS5 trigram support; search indexes not created")
+            return
+        existing = {
+            row[0] for row in connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        for fts_name, (table_name, columns) in SEARCH_INDEXES.items():
+            if fts_name in existing or table_name not in existing:
+                continue
+            for statement in _search_index_ddl(fts_name, table_name, columns):
+                connection.exec_driver_sql(statement)
+            connection.exec_driver_sql(
+                f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')"
+            )
+
+
+def normalize_search_term(search_term: Optional[str]) -> Optional[str]:
+    """
+    Clean up a search term typed into a search box.
+
+    Args:
+        search_term: Raw search term
+
+    Returns:
+        Optional[str]: The stripped term, capped at MAX_SEARCH_TERM_LENGTH
+                      characters, or None if it is shorter than
+                      MIN_SEARCH_TERM_LENGTH and should not be searched
+    """
+    term = (search_term or "").strip()
+    if len(term) < MIN_SEARCH_TERM_LENGTH:
+        return None
+    return term[:MAX_SEARCH_TERM_LENGTH]
+
+
+def _fts_query(term: str) -> str:
+    """Quote a search term as a single FTS5 phrase so it matches as a substring."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _search_index_available(db: Session, fts_name: str) -> bool:
+    """
+    Check whether an FTS table exists in a session's database.
+
+    Args:
+        db: Database session
+        fts_name: Name of the FTS5 virtual table
+
+    Returns:
+        bool: True if the table exists
+    """
+    engine = db.get_bind().engine
+    available = _available_indexes.setdefault(engine, set())
+    if fts_name not in available:
+        exists = db.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": fts_name},
+        ).first()
+        if exists is None:
+            return False
+        available.add(fts_name)
+    return True
+
+
+def search_filter(
+    db: Session,
+    fts_name: str,
+    id_column: ColumnElement,
+    columns: List[ColumnElement],
+    search_term: str,
+) -> ColumnElement:
+    """
+    Build a filter matching rows whose columns contain a search term.
+
+    On SQLite the filter is an FTS index lookup. Other dialects, databases
+    without the FTS table, and terms shorter than the trigram length fall
+    back to ILIKE across the columns.
+
+    Args:
+        db: Database session the filter will run in
+        fts_name: Name of the FTS5 virtual table for the source table
+        id_column: Primary key column of the source table
+        columns: Columns to match with ILIKE when the index cannot be used
+        search_term: Term to search for
+
+    Returns:
+        ColumnElement: Filter expression for the source table query
+    """
+    if (
+        db.get_bind().dialect.name == "sqlite"
+        and len(search_term) >= MIN_FTS_TERM_LENGTH
+        and _search_index_available(db, fts_name)
+    ):
+        matches = text(
+            f"SELECT rowid FROM {fts_name} WHERE {fts_name} MATCH :fts_query"
+        ).bindparams(fts_query=_fts_query(search_term)).columns(column("rowid"))
+        return id_column.in_(matches)
+
+    # Escape LIKE wildcards so "%" and "_" in the term match literally
+    return or_(*(col.icontains(search_term, autoescape=True) for col in columns))
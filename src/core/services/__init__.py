@@ -10,21 +10,9 @@ from src.core.services.spare_part_service import SparePartService
 
 __all__ = [
     "QuoteService",
-    "CustomerService", 
+    "CustomerService",
     "ProductService",
     "initialize_database_if_needed",
     "populate_database",
     "SparePartService"
 ]
-
-"""
-Services package initialization.
-"""
-
-from src.core.services.database_init import initialize_database_if_needed
-from src.core.services.database_populate import populate_database
-
-__all__ = [
-    "initialize_database_if_needed",
-    "populate_database",
-] 
\ No newline at end of file
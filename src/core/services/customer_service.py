@@ -16,9 +16,11 @@ from data access, providing a clean interface for customer management operations
 """
 from typing import List, Optional, Dict, Any
 
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from src.core.models import Customer
+from src.core.search import normalize_search_term, search_filter
 from src.utils.db_utils import add_and_commit, get_by_id, get_all, update_and_commit, delete_and_commit
 
 
@@ -139,6 +141,27 @@ class CustomerService:
         """
         return get_all(db, Customer)
     
+    @staticmethod
+    def get_customers_paginated(db: Session, limit: int = 50, offset: int = 0) -> List[Customer]:
+        """
+        Get one page of customers, ordered by ID.
+        
+        Lets list views load customers a page at a time instead of the whole table.
+        
+        Args:
+            db: Database session
+            limit: Maximum number of customers to return
+            offset: Number of customers to skip
+            
+        Returns:
+            List of Customer objects on the requested page
+            
+        Example:
+            >>> first_page = CustomerService.get_customers_paginated(db, limit=50)
+            >>> second_page = CustomerService.get_customers_paginated(db, limit=50, offset=50)
+        """
+        return db.query(Customer).order_by(Customer.id).limit(limit).offset(offset).all()
+    
     @staticmethod
     def search_customers(db: Session, search_term: str) -> List[Customer]:
         """
@@ -149,13 +172,50 @@ class CustomerService:
             search_term: Search term to match against name, company, or email
             
         Returns:
-            List of matching Customer objects
+            List of matching Customer objects. Terms shorter than two
+            characters (after stripping) return no customers.
+            
+        Note:
+            Uses the customer full-text index on SQLite (see src.core.search).
+            Result lists that only show a few fields can use
+            search_customer_summaries instead.
+        """
+        return CustomerService._search(db, search_term, Customer)
+    
+    @staticmethod
+    def search_customer_summaries(db: Session, search_term: str) -> List[Row]:
+        """
+        Search for customers, loading only the fields shown in search results.
+        
+        Same matching as search_customers, without building Customer objects.
+        
+        Args:
+            db: Database session
+            search_term: Search term to match against name, company, or email
+            
+        Returns:
+            List of matching rows with id, name, company and email attributes.
+            Use get_customer to load the full Customer for a selected match.
         """
-        search_pattern = f"%{search_term}%"
-        return db.query(Customer).filter(
-            (Customer.name.ilike(search_pattern)) |
-            (Customer.company.ilike(search_pattern)) |
-            (Customer.email.ilike(search_pattern))
+        return CustomerService._search(
+            db, search_term, Customer.id, Customer.name, Customer.company, Customer.email
+        )
+    
+    @staticmethod
+    def _search(db: Session, search_term: str, *entities) -> list:
+        """Run a customer search selecting the given entity or columns."""
+        search_term = normalize_search_term(search_term)
+        if search_term is None:
+            return []
+        
+        return db.query(*entities).filter(
+            search_filter(
+                db,
+                "customer_fts",
+                Customer.id,
+                [Customer.name, Customer.company, Customer.email],
+                search_term,
+            )
         ).all()
     
     @staticmethod
@@ -33,6 +33,8 @@ def check_tables_exist():
             "product_families",
             "product_variants",
             "options",
+            "option_product_families",
+            "option_excluded_products",
             "customers",
             "quotes",
             "quote_items",
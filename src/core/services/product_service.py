@@ -15,15 +15,68 @@ implements business logic for:
 The service follows the Repository pattern and provides a clean interface
 for interacting with product-related data and business rules.
 """
+import weakref
 from typing import List, Optional, Dict, Any, Tuple
 
+from sqlalchemy import bindparam, event, or_, select
+from sqlalchemy.engine import Engine, Row
 from sqlalchemy.orm import Session
 
-from src.core.models import Product, Material, Option, MaterialAvailability, VoltageOption, MaterialOption
-from src.core.pricing import calculate_product_price
+from src.core.models import (
+    Product, Material, Option, OptionProductFamily, OptionExcludedProduct, MaterialAvailability, VoltageOption, MaterialOption
+)
+from src.core.pricing import calculate_product_prices, price_product
+from src.core.search import normalize_search_term, search_filter
 from src.utils.db_utils import get_by_id, get_all
 
 
+# Family lookups run on every product selection in the UI; the statements are
+# built once at import so each call only binds the product family
+_AVAILABLE_VOLTAGES_STMT = select(VoltageOption.voltage).where(
+    VoltageOption.product_family == bindparam("product_family"),
+    VoltageOption.is_available == 1
+)
+
+_AVAILABLE_MATERIAL_OPTIONS_STMT = select(
+    MaterialOption.material_code,
+    MaterialOption.display_name,
+    MaterialOption.base_price
+).where(
+    MaterialOption.product_family == bindparam("product_family"),
+    MaterialOption.is_available == 1
+)
+
+
+# Voltage and material option rows per engine and (lookup, product family).
+# The lists rarely change, so they are cached until any session on the engine
+# commits or rolls back, which also covers Core writes and rolled-back data.
+_family_options_cache: "weakref.WeakKeyDictionary[Engine, Dict[Tuple[str, str], tuple]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _family_options(db: Session) -> Dict[Tuple[str, str], tuple]:
+    """Get the family options cache for a session's engine."""
+    return _family_options_cache.setdefault(db.get_bind().engine, {})
+
+
+def clear_family_options_cache() -> None:
+    """Forget the cached per-family voltage and material option lists."""
+    _family_options_cache.clear()
+
+
+def _invalidate_family_options(session: Session, *args) -> None:
+    """Drop the family options cached for a session's engine when its transaction ends."""
+    if session.bind is None:
+        clear_family_options_cache()
+    else:
+        _family_options_cache.pop(session.bind.engine, None)
+
+
+for _event in ("after_commit", "after_soft_rollback"):
+    event.listen(Session, _event, _invalidate_family_options)
+
+
 class ProductService:
     """
     Service class for managing Babbitt International products, configurations, and materials.
@@ -61,19 +114,24 @@ class ProductService:
         db: Session,
         material: Optional[str] = None,
         voltage: Optional[str] = None,
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Product]:
         """
         Retrieve products with optional filtering by material, voltage, or category.
         
         This method allows flexible querying of the product catalog with multiple
-        filter criteria. All filters are optional and can be combined.
+        filter criteria. All filters are optional and can be combined. Passing a
+        limit returns one page of the results, ordered by ID.
         
         Args:
             db: SQLAlchemy database session
             material: Optional material code to filter by (e.g., "S", "H", "U", "T")
             voltage: Optional voltage to filter by (e.g., "115VAC", "24VDC")
             category: Optional category to filter by (e.g., "Level Switch", "Transmitter")
+            limit: Optional page size; all matching products are returned if None
+            offset: Number of matching products to skip when paging
             
         Returns:
             List[Product]: List of Product objects matching the filter criteria
@@ -87,6 +145,8 @@ class ProductService:
             ... )
             >>> # Get all 24VDC products
             >>> products = ProductService.get_products(db, voltage="24VDC")
+            >>> # Get the second page of 50 products
+            >>> products = ProductService.get_products(db, limit=50, offset=50)
         """
         query = db.query(Product)
         
@@ -99,6 +159,9 @@ class ProductService:
         if category is not None:
             query = query.filter(Product.category == category)
             
+        if limit is not None:
+            query = query.order_by(Product.id).limit(limit).offset(offset)
+            
         return query.all()
     
     @staticmethod
@@ -128,7 +191,8 @@ class ProductService:
         Retrieve available voltage options for a specific product family.
         
         This method returns all valid voltage configurations for a given product
-        family, considering compatibility and availability rules.
+        family, considering compatibility and availability rules. Results are
+        cached per family until a session commits or rolls back.
         
         Args:
             db: SQLAlchemy database session
@@ -141,12 +205,13 @@ class ProductService:
             >>> voltages = ProductService.get_available_voltages(db, "LS2000")
             >>> print(f"Available voltages for LS2000: {', '.join(voltages)}")
         """
-        voltages = db.query(VoltageOption).filter(
-            VoltageOption.product_family == product_family,
-            VoltageOption.is_available == 1
-        ).all()
-        
-        return [v.voltage for v in voltages]
+        cache = _family_options(db)
+        key = ("voltages", product_family)
+        if key not in cache:
+            cache[key] = tuple(
+                db.scalars(_AVAILABLE_VOLTAGES_STMT, {"product_family": product_family})
+            )
+        return list(cache[key])
     
     @staticmethod
     def get_available_materials_for_product(db: Session, product_family: str) -> List[Dict[str, Any]]:
@@ -155,6 +220,7 @@ class ProductService:
         
         This method returns detailed material information including display names
         and base prices for materials compatible with the specified product family.
+        Results are cached per family until a session commits or rolls back.
         
         Args:
             db: SQLAlchemy database session
@@ -171,18 +237,22 @@ class ProductService:
             >>> for material in materials:
             ...     print(f"{material['display_name']}: ${material['base_price']:.2f}")
         """
-        materials = db.query(MaterialOption).filter(
-            MaterialOption.product_family == product_family,
-            MaterialOption.is_available == 1
-        ).all()
+        cache = _family_options(db)
+        key = ("materials", product_family)
+        if key not in cache:
+            # Select only the columns the result needs instead of loading full entities
+            cache[key] = tuple(
+                tuple(row) for row in
+                db.execute(_AVAILABLE_MATERIAL_OPTIONS_STMT, {"product_family": product_family})
+            )
         
         return [
             {
-                'code': m.material_code,
-                'display_name': m.display_name,
-                'base_price': m.base_price
+                'code': code,
+                'display_name': display_name,
+                'base_price': base_price
             }
-            for m in materials
+            for code, display_name, base_price in cache[key]
         ]
     
     @staticmethod
@@ -195,7 +265,9 @@ class ProductService:
         
         This method returns product options, considering any exclusion rules if a
         specific product is specified. It handles compatibility checking to ensure
-        only valid options are returned.
+        only valid options are returned: options excluded for the product's model
+        number are left out, and options limited to particular product families
+        are only returned for products of those families.
         
         Args:
             db: SQLAlchemy database session
@@ -217,7 +289,11 @@ class ProductService:
             product = get_by_id(db, Product, product_id)
             if product and product.model_number:
                 query = query.filter(
-                    ~Option.excluded_products.contains(product.model_number)
+                    ~Option.exclusions.any(OptionExcludedProduct.model_number == product.model_number),
+                    or_(
+                        ~Option.families.any(),
+                        Option.families.any(OptionProductFamily.product_family == product.product_type_key)
+                    )
                 )
             
         return query.all()
@@ -247,7 +323,8 @@ class ProductService:
                 - float: Calculated price including all adjustments
             
         Raises:
-            ValueError: If the product is not found
+            ValueError: If the product is not found, or the material is not found
+                       or not available for the product
             
         Example:
             >>> # Configure a 24-inch stainless steel product
@@ -259,20 +336,61 @@ class ProductService:
             ... )
             >>> print(f"Configured price: ${price:.2f}")
         """
-        # Get product
-        product = get_by_id(db, Product, product_id)
-        if not product:
-            raise ValueError(f"Product with ID {product_id} not found")
-            
-        # Calculate price
-        price = calculate_product_price(
+        # Load the product and price it in one query
+        return price_product(
             db=db,
             product_id=product_id,
             length=length,
             material_override=material_override
         )
+    
+    @staticmethod
+    def configure_products(
+        db: Session,
+        configurations: List[Tuple[int, Optional[float], Optional[str]]]
+    ) -> List[Tuple[Product, Optional[float]]]:
+        """
+        Configure many products at once and calculate their prices.
         
-        return product, price
+        Batched form of configure_product for multi-line quotes: the products are
+        loaded with one query and all configurations are priced with one more,
+        instead of several queries per line.
+        
+        Args:
+            db: SQLAlchemy database session
+            configurations: List of (product_id, length, material_override) tuples;
+                          length and material_override may be None
+            
+        Returns:
+            List[Tuple[Product, Optional[float]]]: (product, price) for each
+                configuration, in order. The price is None where the configuration
+                can't be priced (material not found or not available for the product)
+            
+        Raises:
+            ValueError: If any product is not found
+            
+        Example:
+            >>> results = ProductService.configure_products(
+            ...     db,
+            ...     [(1, 24.0, None), (1, 36.0, "H")]
+            ... )
+            >>> for product, price in results:
+            ...     print(product.model_number, price)
+        """
+        product_ids = {product_id for product_id, _, _ in configurations}
+        products = {
+            product.id: product
+            for product in db.query(Product).filter(Product.id.in_(product_ids))
+        }
+        for product_id, _, _ in configurations:
+            if product_id not in products:
+                raise ValueError(f"Product with ID {product_id} not found")
+        
+        prices = calculate_product_prices(db, configurations)
+        return [
+            (products[product_id], price)
+            for (product_id, _, _), price in zip(configurations, prices)
+        ]
         
     @staticmethod
     def search_products(db: Session, search_term: str) -> List[Product]:
@@ -280,14 +398,17 @@ class ProductService:
         Search for products by model number or description.
         
         This method performs a case-insensitive search across product model numbers
-        and descriptions, using partial matching for flexibility.
+        and descriptions, using partial matching for flexibility. On SQLite the
+        match is served by the product full-text index instead of a table scan.
         
         Args:
             db: SQLAlchemy database session
             search_term: Search term to match against product fields
             
         Returns:
-            List[Product]: List of matching Product objects
+            List[Product]: List of products matching the search criteria. Terms
+                          shorter than two characters (after stripping) return
+                          no products
             
         Example:
             >>> # Search for level switches
@@ -295,9 +416,43 @@ class ProductService:
             >>> # Search by model number
             >>> products = ProductService.search_products(db, "LS2000")
         """
-        search_pattern = f"%{search_term}%"
+        return ProductService._search(db, search_term, Product)
+    
+    @staticmethod
+    def search_product_summaries(db: Session, search_term: str) -> List[Row]:
+        """
+        Search for products, loading only the fields shown in search results.
+        
+        Same matching as search_products, without building Product objects.
+        
+        Args:
+            db: SQLAlchemy database session
+            search_term: Search term to match against product fields
+            
+        Returns:
+            List[Row]: Matching rows with id, model_number and description
+                      attributes
+            
+        Example:
+            >>> matches = ProductService.search_product_summaries(db, "LS2000")
+        """
+        return ProductService._search(
+            db, search_term, Product.id, Product.model_number, Product.description
+        )
+    
+    @staticmethod
+    def _search(db: Session, search_term: str, *entities) -> list:
+        """Run a product search selecting the given entity or columns."""
+        search_term = normalize_search_term(search_term)
+        if search_term is None:
+            return []
         
-        return db.query(Product).filter(
-            (Product.description.ilike(search_pattern)) |
-            (Product.model_number.ilike(search_pattern))
+        return db.query(*entities).filter(
+            search_filter(
+                db,
+                "product_fts",
+                Product.id,
+                [Product.description, Product.model_number],
+                search_term,
+            )
         ).all() 
\ No newline at end of file
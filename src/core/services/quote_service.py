@@ -13,10 +13,11 @@ Follows domain-driven design and separates business logic from data access.
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from src.core.models import Quote, QuoteItem, QuoteItemOption, ProductVariant, Option
-from src.core.pricing import calculate_product_price, calculate_option_price
+from src.core.pricing import calculate_product_price
 from src.utils.db_utils import add_and_commit, get_by_id, generate_quote_number
 
 
@@ -30,6 +31,7 @@ class QuoteService:
     Example:
         >>> db = SessionLocal()
         >>> quote = QuoteService.create_quote(db, customer_id=1)
+        >>> quote = QuoteService.get_quote(db, quote.id)
         >>> item = QuoteService.add_product_to_quote(db, quote_id=quote.id, product_id=2)
         >>> option = QuoteService.add_option_to_quote_item(db, quote_item_id=item.id, option_id=3)
         >>> updated = QuoteService.update_quote_status(db, quote_id=quote.id, status="sent")
@@ -71,6 +73,33 @@ class QuoteService:
         
         return add_and_commit(db, quote)
     
+    @staticmethod
+    def get_quote(db: Session, quote_id: int) -> Optional[Quote]:
+        """
+        Get a quote with everything needed to display or export it.
+        
+        The customer is joined in, and the items' product variants, the items'
+        options and the options' Option records are each loaded with one
+        IN-list query, so walking the quote does not issue a query per line.
+        
+        Args:
+            db: Database session
+            quote_id: ID of the quote
+            
+        Returns:
+            Quote object if found, None otherwise
+        """
+        items = selectinload(Quote.items)
+        return db.execute(
+            select(Quote)
+            .options(
+                joinedload(Quote.customer),
+                items.selectinload(QuoteItem.product),
+                items.selectinload(QuoteItem.options).selectinload(QuoteItemOption.option),
+            )
+            .where(Quote.id == quote_id)
+        ).scalar_one_or_none()
+    
     @staticmethod
     def add_product_to_quote(
         db: Session,
@@ -175,11 +204,7 @@ class QuoteService:
             raise ValueError(f"Option with ID {option_id} not found")
         
         # Calculate option price based on the quote item's length if needed
-        price = calculate_option_price(
-            option_price=option.price,
-            option_price_type=option.price_type,
-            length=quote_item.length
-        )
+        price = option.calculate_price(length=quote_item.length)
         
         # Create quote item option
         quote_item_option = QuoteItemOption(
@@ -1,7 +1,15 @@
 """
 UI package for Babbitt Quote Generator
-"""
 
-from src.ui.main_window import MainWindow
+MainWindow is imported on first access so that importing a single tab
+module does not also load the main window and every other tab.
+"""
 
 __all__ = ['MainWindow']
+
+
+def __getattr__(name):
+    if name == 'MainWindow':
+        from src.ui.main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,17 +11,132 @@ The main window serves as the central hub for all quote generation activities,
 coordinating between different tabs and managing the overall application state.
 """
 
+import logging
+import os
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QPushButton, QTabWidget, QMessageBox, QFileDialog
+    QApplication, QPushButton, QTabWidget, QMessageBox, QFileDialog
 )
-from PySide6.QtCore import Qt, Slot, QTimer
+from PySide6.QtCore import Qt, Slot, QEvent, QTimer
 
 from src.ui.product_tab import ProductTab
 from src.ui.specifications_tab import SpecificationsTab
-from src.ui.quote_tab import QuoteTab
+from src.ui.quote_tab import QuoteTab, MODEL_PRICES
 from src.ui.spare_parts_tab import SparePartsTab
 
+logger = logging.getLogger(__name__)
+
+# Application stylesheet, applied by MainWindow.setup_styles
+STYLE_SHEET = """
+    QMainWindow, QWidget {
+        background-color: #F5F5F9;
+        color: #050D10;
+        font-family: Arial, sans-serif;
+    }
+    
+    QGroupBox {
+        border: 1px solid #99AEBD;
+        border-radius: 5px;
+        margin-top: 1em;
+        font-weight: bold;
+    }
+    
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 3px 0 3px;
+    }
+    
+    QLabel#section_header {
+        border-bottom: 1px solid #99AEBD;
+        margin-top: 1em;
+        padding-bottom: 3px;
+        font-weight: bold;
+    }
+    
+    QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox, QTextEdit {
+        border: 1px solid #99AEBD;
+        border-radius: 3px;
+        padding: 5px;
+        background-color: white;
+    }
+    
+    QSlider::groove:horizontal {
+        border: 1px solid #71988C;
+        height: 10px;
+        border-radius: 4px;
+    }
+    
+    QSlider::handle:horizontal {
+        background: #08D13F;
+        border: 1px solid #5c5c5c;
+        width: 18px;
+        border-radius: 9px;
+        margin: -5px 0;
+    }
+    
+    QPushButton {
+        background-color: #71988C;
+        color: white;
+        border: none;
+        border-radius: 3px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    
+    QPushButton:hover {
+        background-color: #08D13F;
+    }
+    
+    QPushButton:disabled {
+        background-color: #CCCCCC;
+        color: #666666;
+    }
+    
+    #export_button {
+        background-color: #08D13F;
+    }
+    
+    #export_button:hover {
+        background-color: #05A32F;
+    }
+    
+    QTabWidget::pane {
+        border: 1px solid #99AEBD;
+        border-radius: 5px;
+    }
+    
+    QTabBar::tab {
+        background-color: #99AEBD;
+        color: white;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    
+    QTabBar::tab:selected {
+        background-color: #71988C;
+    }
+    
+    QTableWidget {
+        border: 1px solid #99AEBD;
+        gridline-color: #DDDDDD;
+    }
+    
+    QTableWidget::item {
+        padding: 4px;
+    }
+    
+    QHeaderView::section {
+        background-color: #71988C;
+        color: white;
+        padding: 4px;
+        border: 1px solid #99AEBD;
+    }
+"""
+
 class MainWindow(QMainWindow):
     """
     Main application window for the Babbitt Quote Generator.
@@ -41,6 +156,7 @@ class MainWindow(QMainWindow):
         specifications_tab (SpecificationsTab): Tab for product specifications
         quote_tab (QuoteTab): Tab for quote management
         spare_parts_tab (SparePartsTab): Tab for spare parts selection
+            (each tab is built on first access or when first shown)
         prev_button (QPushButton): Navigation button for previous tab
         next_button (QPushButton): Navigation button for next tab
         save_button (QPushButton): Button to save current quote
@@ -53,14 +169,27 @@ class MainWindow(QMainWindow):
         part_selected: Emitted when a spare part is selected
     """
     
+    # Title and class of each tab, in tab order
+    TAB_FACTORIES = [
+        ("Product Selection", ProductTab),
+        ("Specifications", SpecificationsTab),
+        ("Quote Summary", QuoteTab),
+        ("Spare Parts", SparePartsTab),
+    ]
+    
+    # Tab indexes, matching TAB_FACTORIES
+    PRODUCT_TAB, SPECIFICATIONS_TAB, QUOTE_TAB, SPARE_PARTS_TAB = range(4)
+    
+    # Idle time after the last specs change before the quote tab is updated
+    SPECS_UPDATE_DELAY_MS = 50
+    
     def __init__(self):
         """Initialize the main window and set up the UI components."""
         super().__init__()
         self.setWindowTitle("Babbitt Quote Generator")
         self.resize(1000, 800)
         
-        # Print debug info
-        print("MainWindow.__init__() called")
+        logger.debug("MainWindow.__init__() called")
         
         # Main widget and layout
         self.central_widget = QWidget()
@@ -71,20 +200,31 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.main_layout.addWidget(self.tabs)
         
-        # Create tabs for each section
-        print("Creating ProductTab...")
-        self.product_tab = ProductTab()
-        print("Creating SpecificationsTab...")
-        self.specifications_tab = SpecificationsTab()
-        print("Creating QuoteTab...")
-        self.quote_tab = QuoteTab()
-        print("Creating SparePartsTab...")
-        self.spare_parts_tab = SparePartsTab()
-        
-        self.tabs.addTab(self.product_tab, "Product Selection")
-        self.tabs.addTab(self.specifications_tab, "Specifications")
-        self.tabs.addTab(self.quote_tab, "Quote Summary")
-        self.tabs.addTab(self.spare_parts_tab, "Spare Parts")
+        # Product info from the last product_selected signal
+        self._current_product_info = None
+        
+        # Latest specs waiting to be shown on the quote tab
+        self._pending_specs = None
+        self._specs_flush_timer = QTimer(self)
+        self._specs_flush_timer.setSingleShot(True)
+        self._specs_flush_timer.setInterval(self.SPECS_UPDATE_DELAY_MS)
+        self._specs_flush_timer.timeout.connect(self._flush_specs)
+        
+        # Add a placeholder for each section; the real tab is built the first
+        # time it is shown or used, so only the first tab is built at startup
+        self._tab_instances = [None] * len(self.TAB_FACTORIES)
+        
+        # Hide the tab bar while adding so tab size hints are computed once
+        tab_bar = self.tabs.tabBar()
+        self.tabs.setUpdatesEnabled(False)
+        tab_bar.setVisible(False)
+        try:
+            for title, _ in self.TAB_FACTORIES:
+                self.tabs.addTab(QWidget(), title)
+            self._ensure_tab(self.PRODUCT_TAB)
+        finally:
+            tab_bar.setVisible(True)
+            self.tabs.setUpdatesEnabled(True)
         
         # Bottom buttons for navigation and actions
         self.button_layout = QHBoxLayout()
@@ -102,52 +242,117 @@ class MainWindow(QMainWindow):
         self.main_layout.addLayout(self.button_layout)
         
         # Connect tab signals
-        print("Connecting signals...")
+        logger.debug("Connecting signals...")
         self._connect_signals()
         
         # Apply initial button states
         self.update_button_states()
         
-        # Add a timer to check window state
-        self.check_timer = QTimer(self)
-        self.check_timer.timeout.connect(self.check_window_state)
-        self.check_timer.start(1000)  # Check every second
-        
-        print("MainWindow initialization complete")
+        logger.debug("MainWindow initialization complete")
     
     def showEvent(self, event):
         """Called when the window is shown."""
         super().showEvent(event)
-        print(f"Window shown: Geometry = {self.geometry().x()}, {self.geometry().y()}, {self.geometry().width()}, {self.geometry().height()}")
-        print(f"Window visible: {self.isVisible()}")
-        print(f"Window active: {self.isActiveWindow()}")
-    
-    def check_window_state(self):
-        """Check the window state and print debug info."""
-        print(f"Window check: Visible={self.isVisible()}, Active={self.isActiveWindow()}, Minimized={self.isMinimized()}")
-        # Stop the timer after a few checks
-        if hasattr(self, 'check_count'):
-            self.check_count += 1
-            if self.check_count > 5:
-                self.check_timer.stop()
-        else:
-            self.check_count = 1
+        if logger.isEnabledFor(logging.DEBUG):
+            geometry = self.geometry()
+            logger.debug(
+                "Window shown: Geometry = %s, %s, %s, %s",
+                geometry.x(), geometry.y(), geometry.width(), geometry.height()
+            )
+            logger.debug("Window visible: %s", self.isVisible())
+            logger.debug("Window active: %s", self.isActiveWindow())
+    
+    def changeEvent(self, event):
+        """Called when the window's state or activation changes."""
+        if event.type() in (QEvent.WindowStateChange, QEvent.ActivationChange):
+            logger.debug(
+                "Window state changed: Visible=%s, Active=%s, Minimized=%s",
+                self.isVisible(), self.isActiveWindow(), self.isMinimized()
+            )
+        super().changeEvent(event)
+    
+    def _ensure_tab(self, index):
+        """
+        Get the tab at an index, building it in place of its placeholder if needed.
+        
+        Args:
+            index (int): Index of the tab
+            
+        Returns:
+            QWidget: The tab widget
+        """
+        tab = self._tab_instances[index]
+        if tab is not None:
+            return tab
+        
+        title, factory = self.TAB_FACTORIES[index]
+        logger.debug("Creating %s...", factory.__name__)
+        tab = factory()
+        self._tab_instances[index] = tab
+        self._connect_tab_signals(tab)
+        
+        # Swap the placeholder out without reporting the intermediate tab changes
+        current_index = self.tabs.currentIndex()
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, title)
+            self.tabs.setCurrentIndex(current_index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        return tab
+    
+    @property
+    def product_tab(self):
+        """ProductTab: Tab for product selection."""
+        return self._ensure_tab(self.PRODUCT_TAB)
+    
+    @property
+    def specifications_tab(self):
+        """SpecificationsTab: Tab for product specifications."""
+        return self._ensure_tab(self.SPECIFICATIONS_TAB)
+    
+    @property
+    def quote_tab(self):
+        """QuoteTab: Tab for quote management."""
+        return self._ensure_tab(self.QUOTE_TAB)
+    
+    @property
+    def spare_parts_tab(self):
+        """SparePartsTab: Tab for spare parts selection."""
+        return self._ensure_tab(self.SPARE_PARTS_TAB)
+    
+    def _connect_tab_signals(self, tab):
+        """
+        Connect the signals of a newly built tab to the main window handlers.
+        
+        The connections are queued so the emitting tab's handler returns
+        before the other tabs are updated, instead of waiting on their
+        database lookups and widget rebuilds.
+        
+        Args:
+            tab (QWidget): The tab that was just built
+        """
+        if isinstance(tab, ProductTab):
+            tab.product_selected.connect(self.on_product_selected, Qt.QueuedConnection)
+        elif isinstance(tab, SpecificationsTab):
+            tab.specs_updated.connect(self.on_specs_updated, Qt.QueuedConnection)
+            tab.add_to_quote.connect(self.on_specs_add_to_quote, Qt.QueuedConnection)
+        elif isinstance(tab, SparePartsTab):
+            tab.part_selected.connect(self.on_spare_part_selected, Qt.QueuedConnection)
     
     def _connect_signals(self):
         """
         Connect all signal handlers for the main window.
         
         Sets up connections between:
-        - Tab signals (product selection, specs updates, etc.)
         - Button click handlers
         - Tab change events
-        """
-        # Tab signals
-        self.product_tab.product_selected.connect(self.on_product_selected)
-        self.specifications_tab.specs_updated.connect(self.on_specs_updated)
-        self.specifications_tab.add_to_quote.connect(self.on_specs_add_to_quote)
-        self.spare_parts_tab.part_selected.connect(self.on_spare_part_selected)
         
+        Each tab's own signals are connected when the tab is built.
+        """
         # Button signals
         self.next_button.clicked.connect(self.next_tab)
         self.prev_button.clicked.connect(self.prev_tab)
@@ -166,9 +371,11 @@ class MainWindow(QMainWindow):
         Args:
             model (str): The model number/identifier of the selected product
         """
-        print(f"Product selected: {model}")
-        # Get full product info including derived category
+        logger.debug("Product selected: %s", model)
+        # Get full product info including derived category; kept until the
+        # next selection since the product tab cannot change without one
         product_info = self.product_tab.get_selected_product()
+        self._current_product_info = product_info
         category = product_info["category"]
         
         # Update specifications tab with product info
@@ -177,17 +384,38 @@ class MainWindow(QMainWindow):
         # Update quote tab with product info
         self.quote_tab.update_product_info(product_info)
     
+    @Slot(dict)
     def on_specs_updated(self, specs):
         """
         Handle specification update events.
         
-        Updates the quote tab with the modified specifications.
+        Updates the quote tab with the modified specifications. Updates are
+        deferred until SPECS_UPDATE_DELAY_MS passes without another change.
         
         Args:
             specs (dict): Dictionary containing the updated specifications
         """
-        print("Specifications updated")
-        # Update quote tab with specifications
+        logger.debug("Specifications updated")
+        # Keep only the latest specs; restarting the timer coalesces a burst of
+        # edits into a single quote tab update once editing pauses
+        self._pending_specs = specs
+        self._specs_flush_timer.start()
+    
+    @Slot()
+    def _flush_specs(self):
+        """Apply pending specifications to the quote tab, if any."""
+        self._specs_flush_timer.stop()
+        
+        # Include a change the specifications tab has not emitted yet
+        specifications_tab = self._tab_instances[self.SPECIFICATIONS_TAB]
+        if specifications_tab is not None:
+            specs = specifications_tab.take_pending_specs()
+            if specs is not None:
+                self._pending_specs = specs
+        
+        if self._pending_specs is None:
+            return
+        specs, self._pending_specs = self._pending_specs, None
         self.quote_tab.update_specifications(specs)
     
     def update_button_states(self):
@@ -205,16 +433,20 @@ class MainWindow(QMainWindow):
         # Enable/disable next button
         self.next_button.setEnabled(current_index < self.tabs.count() - 1)
     
+    @Slot(int)
     def on_tab_changed(self, index):
         """
         Handle tab change events.
         
-        Updates button states when the active tab changes.
+        Builds the newly selected tab if it has not been shown before, and
+        updates button states.
         
         Args:
             index (int): Index of the newly selected tab
         """
-        print(f"Tab changed to: {index}")
+        logger.debug("Tab changed to: %s", index)
+        if index >= 0:
+            self._ensure_tab(index)
         self.update_button_states()
     
     @Slot()
@@ -243,12 +475,14 @@ class MainWindow(QMainWindow):
         Raises:
             QMessageBox: Warning if no product is selected
         """
-        print("Save quote action triggered")
-        # Get quote data
+        logger.debug("Save quote action triggered")
+        # Get quote data, including any specs change still waiting to be applied
+        self._flush_specs()
         quote_data = self.quote_tab.get_quote_data()
         
         # Check if product is selected
-        if not quote_data['product'].get('model'):
+        product_model = quote_data['product'].get('model')
+        if not product_model:
             QMessageBox.warning(self, "Missing Product", 
                 "Please select a product before saving the quote.")
             return
@@ -256,7 +490,6 @@ class MainWindow(QMainWindow):
         # In the full implementation, this would save to your database
         # For now, we'll just show a success message
         customer_name = quote_data['customer'].get('name', 'Customer')
-        product_model = quote_data['product'].get('model', 'Unknown')
         
         QMessageBox.information(self, "Quote Saved", 
             f"Quote for {customer_name} for {product_model} has been saved.")
@@ -273,8 +506,9 @@ class MainWindow(QMainWindow):
         Raises:
             QMessageBox: Warning if no product is selected
         """
-        print("Export quote action triggered")
-        # Get quote data
+        logger.debug("Export quote action triggered")
+        # Get quote data, including any specs change still waiting to be applied
+        self._flush_specs()
         quote_data = self.quote_tab.get_quote_data()
         
         # Check if product is selected
@@ -290,7 +524,7 @@ class MainWindow(QMainWindow):
         if not file_path:
             return  # User cancelled
             
-        if not file_path.lower().endswith('.pdf'):
+        if os.path.splitext(file_path)[1].lower() != '.pdf':
             file_path += '.pdf'
         
         # In the full implementation, this would call your PDF export functionality
@@ -308,13 +542,13 @@ class MainWindow(QMainWindow):
         Args:
             part_info (dict): Dictionary containing spare part information
         """
-        print(f"Spare part selected: {part_info['part_number']}")
+        logger.debug("Spare part selected: %s", part_info['part_number'])
         
         # Add the spare part to the quote
         self.quote_tab.add_spare_part_to_quote(part_info)
         
         # Switch to quote tab to see the added part
-        self.tabs.setCurrentWidget(self.quote_tab)
+        self.tabs.setCurrentIndex(self.QUOTE_TAB)
     
     @Slot(dict)
     def on_specs_add_to_quote(self, specs):
@@ -330,10 +564,13 @@ class MainWindow(QMainWindow):
         Raises:
             QMessageBox: Warning if no product is selected
         """
-        print("Adding specifications to quote")
+        logger.debug("Adding specifications to quote")
+        self._flush_specs()
         
         # Get the current product info
-        product_info = self.product_tab.get_selected_product()
+        product_info = self._current_product_info
+        if product_info is None:
+            product_info = self.product_tab.get_selected_product()
         
         # Create a description for the quote item
         if product_info and product_info.get("model"):
@@ -345,7 +582,7 @@ class MainWindow(QMainWindow):
                 f"{product_info.get('model')} has been added to your quote.")
             
             # Switch to the Quote tab
-            self.tabs.setCurrentWidget(self.quote_tab)
+            self.tabs.setCurrentIndex(self.QUOTE_TAB)
         else:
             QMessageBox.warning(self, "No Product Selected", 
                 "Please select a product before adding to quote.")
@@ -366,23 +603,10 @@ class MainWindow(QMainWindow):
         
         # This would normally be done in a proper pricing module
         model = product_info.get("model", "")
-        base_model = model.split()[0] if model else ""
-        
-        # Set base prices for each model (simplified example)
-        model_prices = {
-            "LS2000": 800.0,  # General Purpose
-            "LS2100": 700.0,  # Loop Powered
-            "LS6000": 900.0,  # Heavy Duty
-            "LS7000": 1200.0, # Advanced Features
-            "LS7000/2": 1500.0, # Dual Point
-            "LS8000": 1100.0, # Remote Mounted
-            "LS8000/2": 1400.0, # Remote Mounted Dual Point
-            "LT9000": 1800.0,  # Level Transmitter
-            "FS10000": 950.0   # Flow Switch
-        }
+        base_model = model.split(None, 1)[0] if model.strip() else ""
         
         # Get base price for the model
-        base_price = model_prices.get(base_model, 0.0)
+        base_price = MODEL_PRICES.get(base_model, 0.0)
         
         # This is a simplified version - in a real app, you'd have more sophisticated pricing
         # Call the appropriate method in the quote tab to add this product
@@ -400,109 +624,10 @@ class MainWindow(QMainWindow):
     
     def setup_styles(self):
         """Apply stylesheets for a clean UI."""
-        print("Applying styles...")
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #F5F5F9;
-                color: #050D10;
-                font-family: Arial, sans-serif;
-            }
-            
-            QGroupBox {
-                border: 1px solid #99AEBD;
-                border-radius: 5px;
-                margin-top: 1em;
-                font-weight: bold;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 3px 0 3px;
-            }
-            
-            QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox, QTextEdit {
-                border: 1px solid #99AEBD;
-                border-radius: 3px;
-                padding: 5px;
-                background-color: white;
-            }
-            
-            QSlider::groove:horizontal {
-                border: 1px solid #71988C;
-                height: 10px;
-                border-radius: 4px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #08D13F;
-                border: 1px solid #5c5c5c;
-                width: 18px;
-                border-radius: 9px;
-                margin: -5px 0;
-            }
-            
-            QPushButton {
-                background-color: #71988C;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: #08D13F;
-            }
-            
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #666666;
-            }
-            
-            #export_button {
-                background-color: #08D13F;
-            }
-            
-            #export_button:hover {
-                background-color: #05A32F;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #99AEBD;
-                border-radius: 5px;
-            }
-            
-            QTabBar::tab {
-                background-color: #99AEBD;
-                color: white;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #71988C;
-            }
-            
-            QTableWidget {
-                border: 1px solid #99AEBD;
-                gridline-color: #DDDDDD;
-            }
-            
-            QTableWidget::item {
-                padding: 4px;
-            }
-            
-            QHeaderView::section {
-                background-color: #71988C;
-                color: white;
-                padding: 4px;
-                border: 1px solid #99AEBD;
-            }
-        """)
-        
+        logger.debug("Applying styles...")
         # Set object names for styling
         self.export_button.setObjectName("export_button")
-        print("Styles applied successfully") 
\ No newline at end of file
+        
+        # Set on the application so Qt parses the rules once for every window and dialog
+        QApplication.instance().setStyleSheet(STYLE_SHEET)
+        logger.debug("Styles applied successfully") 
\ No newline at end of file
@@ -15,7 +15,8 @@ from PySide6.QtWidgets import (
     QComboBox, QGroupBox, QFormLayout, QSpacerItem,
     QSizePolicy, QListWidget, QListWidgetItem
 )
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 
 class ProductTab(QWidget):
@@ -54,6 +55,9 @@ class ProductTab(QWidget):
         super().__init__(parent)
         self.init_ui()
         
+        # Model number last emitted with product_selected
+        self._last_selected_model = None
+        
         # Connect signals
         self.product_model.currentIndexChanged.connect(self.on_model_changed)
         
@@ -88,8 +92,14 @@ class ProductTab(QWidget):
             "FS10000": "Flow Switch"
         }
         
+        # Fill a detached model and attach it once, rather than inserting
+        # into the combo box one item at a time
+        model_items = QStandardItemModel(self.product_model)
         for model, description in self.models.items():
-            self.product_model.addItem(f"{model} - {description}", model)
+            item = QStandardItem(f"{model} - {description}")
+            item.setData(model, Qt.UserRole)
+            model_items.appendRow(item)
+        self.product_model.setModel(model_items)
         
         model_layout.addRow("Select Model:", self.product_model)
         self.model_group.setLayout(model_layout)
@@ -114,13 +124,17 @@ class ProductTab(QWidget):
         Handle model selection changes.
         
         Updates the product information display and emits a signal when
-        a new model is selected.
+        a new model is selected. Nothing happens if the model is the one
+        already selected.
         
         Args:
             index (int): Index of the newly selected item in the combo box
         """
         if index >= 0:
             model = self.product_model.currentData()  # Get the model number from the combobox data
+            if model == self._last_selected_model:
+                return
+            self._last_selected_model = model
             
             # Update product info
             self.update_product_info(model)
@@ -12,18 +12,232 @@ The tab serves as the central location for reviewing and finalizing quotes
 before they are saved or exported.
 """
 
+from collections.abc import Hashable
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QGroupBox, QFormLayout, QSpacerItem,
     QSizePolicy, QPushButton, QTextEdit, QTableWidget,
-    QTableWidgetItem, QHeaderView
+    QTableWidgetItem, QHeaderView, QTableView, QStyledItemDelegate,
+    QStyleOptionViewItem
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush, QFont
 from PySide6.QtCore import QTimer
 from src.core.database import SessionLocal
 from src.core.models.connection_option import ConnectionOption
 
+# Configuration summary categories and the specs shown in each, in display order
+SPEC_CATEGORIES = (
+    ("Essential Properties", ("voltage", "material", "material_type", "viscosity")),
+    ("Dimensions", ("probe_length", "indicator_length", "cable_length")),
+    ("Connections", ("connection", "mounting")),
+    ("Material Options", ("exotic_metals", "oring")),
+    ("Housing", ("housing",)),
+    ("Additional Features", ("high_temp", "extended_probe", "remote_display", "output_type")),
+)
+SPEC_CATEGORY_NAMES = tuple(category for category, _ in SPEC_CATEGORIES)
+
+# Spec name -> (category index, index within the category)
+SPEC_POSITIONS = {
+    name: (category_index, spec_index)
+    for category_index, (_, spec_names) in enumerate(SPEC_CATEGORIES)
+    for spec_index, name in enumerate(spec_names)
+}
+
+# Base prices for each model (simplified example)
+MODEL_PRICES = {
+    "LS2000": 800.0,  # General Purpose
+    "LS2100": 700.0,  # Loop Powered
+    "LS6000": 900.0,  # Heavy Duty
+    "LS7000": 1200.0, # Advanced Features
+    "LS7000/2": 1500.0, # Dual Point
+    "LS8000": 1100.0, # Remote Mounted
+    "LS8000/2": 1400.0, # Remote Mounted Dual Point
+    "LT9000": 1800.0,  # Level Transmitter
+    "FS10000": 950.0   # Flow Switch
+}
+
+# Surcharges for options shown as "<code> - <name>", keyed by the code
+MATERIAL_SURCHARGES = {"H": 400.0, "A": 50.0}  # Hastelloy, Aluminum
+EXOTIC_METAL_SURCHARGES = {"T": 600.0, "U": 500.0}  # Titanium, Monel
+
+# Surcharges for options shown by name, keyed by the casefolded name
+ORING_SURCHARGES = {"kalrez": 120.0, "ptfe": 80.0, "epdm": 40.0}
+HOUSING_SURCHARGES = {"explosion-proof": 300.0, "stainless steel": 200.0}
+OUTPUT_TYPE_SURCHARGES = {"hart": 300.0, "modbus rtu": 250.0}  # For transmitters
+
+# Surcharges for features that are either on or off
+FEATURE_SURCHARGES = {"high_temp": 150.0, "extended_probe": 100.0, "remote_display": 250.0}
+
+STANDARD_PROBE_LENGTH = 10  # Standard length is 10" for most models
+STANDARD_CABLE_LENGTH = 10  # Standard cable length is 10 feet
+
+
+def _code_pricer(surcharges):
+    """Price an option by the code before " - " in its value."""
+    def price(value, base_model):
+        return surcharges.get(str(value).split(" - ", 1)[0].strip(), 0.0)
+    return price
+
+
+def _choice_pricer(surcharges):
+    """Price an option by its casefolded value."""
+    def price(value, base_model):
+        return surcharges.get(str(value).casefold(), 0.0)
+    return price
+
+
+def _feature_pricer(amount):
+    """Price an option that costs a fixed amount when enabled."""
+    def price(value, base_model):
+        return amount if value else 0.0
+    return price
+
+
+def _probe_length_price(value, base_model):
+    """Price the probe length beyond the standard length."""
+    if not isinstance(value, (int, float)) or value <= STANDARD_PROBE_LENGTH:
+        return 0.0
+    per_inch = 8.0 if base_model in ("LS2000", "LS2100") else 12.0
+    return (value - STANDARD_PROBE_LENGTH) * per_inch
+
+
+def _cable_length_price(value, base_model):
+    """Price the cable length beyond the standard length."""
+    if not isinstance(value, (int, float)) or value <= STANDARD_CABLE_LENGTH:
+        return 0.0
+    return (value - STANDARD_CABLE_LENGTH) * 5.0  # $5 per foot over standard
+
+
+# Spec name -> function(value, base_model) returning the option price
+OPTION_PRICERS = {
+    "material": _code_pricer(MATERIAL_SURCHARGES),
+    "exotic_metals": _code_pricer(EXOTIC_METAL_SURCHARGES),
+    "oring": _choice_pricer(ORING_SURCHARGES),
+    "housing": _choice_pricer(HOUSING_SURCHARGES),
+    "output_type": _choice_pricer(OUTPUT_TYPE_SURCHARGES),
+    "probe_length": _probe_length_price,
+    "cable_length": _cable_length_price,
+    **{name: _feature_pricer(amount) for name, amount in FEATURE_SURCHARGES.items()},
+}
+
+
+def _freeze(values):
+    """
+    Build a hashable snapshot of a dictionary for change detection.
+    
+    Args:
+        values (dict): Dictionary to snapshot
+        
+    Returns:
+        tuple: Sorted (key, value) pairs, with unhashable values replaced by their repr
+    """
+    return tuple(sorted(
+        (key, value if isinstance(value, Hashable) else repr(value))
+        for key, value in values.items()
+    ))
+
+
+class SpecsTableModel(QAbstractTableModel):
+    """
+    Table model for the configuration summary in the quote tab.
+    
+    Each row is a (is_header, name, value) tuple. Header rows name a category
+    of specifications and are drawn bold on a gray background; the view spans
+    them across both columns. The header flag is available as Qt.UserRole
+    data. Backing the summary with a model lets the view
+    draw only the visible cells instead of creating an item per cell.
+    
+    Attributes:
+        rows (list): (is_header, name, value) tuple for each row
+    """
+    
+    HEADERS = ("Configuration Item", "Value")
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the model with no rows.
+        
+        Args:
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.rows = []
+        
+        self._spec_font = QFont("Arial", 9)
+        self._header_font = QFont("Arial", 9)
+        self._header_font.setBold(True)
+        self._header_brush = QBrush(Qt.lightGray)
+    
+    def set_rows(self, rows):
+        """
+        Replace all rows of the model in a single reset.
+        
+        Args:
+            rows (list): (is_header, name, value) tuple for each row
+        """
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows."""
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the data for a cell and role."""
+        if not index.isValid():
+            return None
+        
+        is_header, name, value = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return name
+            return None if is_header else value
+        if role == Qt.UserRole:
+            return is_header
+        if role == Qt.FontRole:
+            return self._header_font if is_header else self._spec_font
+        if role == Qt.BackgroundRole and is_header:
+            return self._header_brush
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return the column titles."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class SpecsItemDelegate(QStyledItemDelegate):
+    """
+    Item delegate that indents spec names under their category header.
+    
+    The indent is applied when the cell is painted, so the model returns
+    the spec names unchanged.
+    """
+    
+    INDENT = 16  # pixels
+    
+    def paint(self, painter, option, index):
+        """Paint the cell, shifting spec names right of their header."""
+        if index.column() == 0 and not index.data(Qt.UserRole):
+            option = QStyleOptionViewItem(option)
+            option.rect = option.rect.adjusted(self.INDENT, 0, 0, 0)
+        super().paint(painter, option, index)
+    
+    def sizeHint(self, option, index):
+        """Return the cell size, including the indent for spec names."""
+        size = super().sizeHint(option, index)
+        if index.column() == 0 and not index.data(Qt.UserRole):
+            size.setWidth(size.width() + self.INDENT)
+        return size
+
 
 class QuoteTab(QWidget):
     """
@@ -45,7 +259,8 @@ class QuoteTab(QWidget):
         specs (dict): Current product specifications
         pricing (dict): Current pricing calculations
         product_summary (QLabel): Label showing selected product
-        specs_table (QTableWidget): Table showing product configuration
+        specs_model (SpecsTableModel): Model holding the product configuration
+        specs_table (QTableView): Table showing product configuration
         items_table (QTableWidget): Table showing quote items
         status_label (QLabel): Label for status messages
         base_price_label (QLabel): Label showing base price
@@ -64,6 +279,12 @@ class QuoteTab(QWidget):
     # Signals
     customer_updated = Signal(dict)  # customer information dictionary
     
+    # Idle time after the last customer field edit before customer_updated is emitted
+    CUSTOMER_UPDATE_DELAY_MS = 150
+    
+    # Product summary shown when a product is selected
+    PRODUCT_SUMMARY_TEMPLATE = "<b>{model}</b><br>Application: {application}"
+    
     def __init__(self, parent=None):
         """
         Initialize the QuoteTab.
@@ -72,11 +293,27 @@ class QuoteTab(QWidget):
             parent (QWidget, optional): Parent widget. Defaults to None.
         """
         super().__init__(parent)
+        
+        # Fonts shared by the quote items and price labels on every update
+        self._item_font = QFont("Arial", 9)
+        self._total_font = QFont("Arial", 10)
+        self._total_font.setBold(True)
+        
+        # Customer information from the form, rebuilt after a field changes
+        self._customer_cache = None
+        
+        # Typing in the customer fields emits customer_updated once per pause
+        self._customer_update_timer = QTimer(self)
+        self._customer_update_timer.setSingleShot(True)
+        self._customer_update_timer.setInterval(self.CUSTOMER_UPDATE_DELAY_MS)
+        self._customer_update_timer.timeout.connect(self._emit_customer_update)
+        
         self.init_ui()
         
         # Initialize data structures
         self.product_info = {}
         self.specs = {}
+        self._last_pricing_key = None
         self.pricing = {
             "base_price": 0.0,
             "options_price": 0.0,
@@ -107,8 +344,12 @@ class QuoteTab(QWidget):
         summary_layout.addWidget(self.product_summary)
         
         # Configuration summary
-        self.specs_table = QTableWidget(0, 2)
-        self.specs_table.setHorizontalHeaderLabels(["Configuration Item", "Value"])
+        self.specs_model = SpecsTableModel(self)
+        self.specs_table = QTableView()
+        self.specs_table.setModel(self.specs_model)
+        self.specs_table.setItemDelegateForColumn(0, SpecsItemDelegate(self.specs_table))
+        self.specs_table.verticalHeader().setDefaultSectionSize(
+            self.specs_table.fontMetrics().height() + 8)
         self.specs_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.specs_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.specs_table.verticalHeader().setVisible(False)
@@ -211,10 +452,9 @@ class QuoteTab(QWidget):
         application = product_info.get("application", "")
         
         if model:
-            self.product_summary.setFont(QFont("Arial", 10))
-            self.product_summary.setText(f"<b>{model}</b><br>Application: {application}")
+            self.product_summary.setText(
+                self.PRODUCT_SUMMARY_TEMPLATE.format(model=model, application=application))
         else:
-            self.product_summary.setFont(QFont("Arial", 10))
             self.product_summary.setText("No product selected")
         
         # Update pricing
@@ -232,90 +472,62 @@ class QuoteTab(QWidget):
         """
         self.specs = specs
         
-        # Clear existing specs
-        self.specs_table.setRowCount(0)
-        
-        # Group configuration items by category
-        config_categories = {
-            "Essential Properties": ["voltage", "material", "material_type", "viscosity"],
-            "Dimensions": ["probe_length", "indicator_length", "cable_length"],
-            "Connections": ["connection", "mounting"],
-            "Material Options": ["exotic_metals", "oring"],
-            "Housing": ["housing"],
-            "Additional Features": ["high_temp", "extended_probe", "remote_display", "output_type"]
-        }
-        
-        # Add category headers and specs in each category
-        for category, spec_keys in config_categories.items():
-            category_added = False
+        # Price each spec and collect the ones shown in the summary in one pass
+        base_model = self._base_model()
+        options_price = 0.0
+        known_specs = []
+        for name, value in specs.items():
+            option_price = OPTION_PRICERS.get(name)
+            if option_price:
+                options_price += option_price(value, base_model)
+            if name in SPEC_POSITIONS:
+                known_specs.append((SPEC_POSITIONS[name], name))
+        
+        # Order the known specs by category, then by position within it
+        known_specs.sort()
+        
+        # Build a category header row followed by the specs in each category
+        rows = []
+        current_category = None
+        for (category_index, _), name in known_specs:
+            # Add category header if this is the first spec in the category
+            if category_index != current_category:
+                rows.append((True, SPEC_CATEGORY_NAMES[category_index], ""))
+                current_category = category_index
             
-            for name in spec_keys:
-                if name in specs:
-                    # Add category header if this is the first spec in the category
-                    if not category_added:
-                        self._add_category_row(category)
-                        category_added = True
-                    
-                    # Convert internal name to display name
-                    display_name = name.replace("_", " ").title()
-                    
-                    # Format value for display
-                    value = specs[name]
-                    if isinstance(value, bool):
-                        display_value = "Yes" if value else "No"
-                    else:
-                        display_value = str(value)
-                    
-                    # Add to table
-                    self._add_spec_row(display_name, display_value)
-        
-        # Update pricing
-        self.update_pricing()
-    
-    def _add_category_row(self, category_name):
-        """
-        Add a category header row to the specifications table.
-        
-        Args:
-            category_name (str): Name of the category to add
-        """
-        row = self.specs_table.rowCount()
-        self.specs_table.insertRow(row)
-        
-        category_item = QTableWidgetItem(category_name)
-        category_item.setBackground(Qt.lightGray)
+            # Convert internal name to display name
+            display_name = name.replace("_", " ").title()
+            
+            # Format value for display
+            value = specs[name]
+            if isinstance(value, bool):
+                display_value = "Yes" if value else "No"
+            else:
+                display_value = str(value)
+            
+            rows.append((False, display_name, display_value))
         
-        font = QFont("Arial", 9)
-        font.setBold(True)
-        category_item.setFont(font)
+        # Replace the table contents and span the headers across both columns,
+        # repainting once at the end rather than after each span
+        self.specs_table.setUpdatesEnabled(False)
+        try:
+            self.specs_model.set_rows(rows)
+            self.specs_table.clearSpans()
+            for row, (is_header, _, _) in enumerate(rows):
+                if is_header:
+                    self.specs_table.setSpan(row, 0, 1, 2)
+        finally:
+            self.specs_table.setUpdatesEnabled(True)
         
-        # Span both columns
-        self.specs_table.setItem(row, 0, category_item)
-        self.specs_table.setSpan(row, 0, 1, 2)
+        # Update pricing with the options priced above
+        self.update_pricing(options_price)
     
-    def _add_spec_row(self, name, value):
-        """
-        Add a specification row to the specifications table.
-        
-        Args:
-            name (str): Name of the specification
-            value (str): Value of the specification
-        """
-        row = self.specs_table.rowCount()
-        self.specs_table.insertRow(row)
-        
-        # Add indent to name for better visual hierarchy
-        name_item = QTableWidgetItem("    " + name)
-        value_item = QTableWidgetItem(value)
-        
-        font = QFont("Arial", 9)
-        name_item.setFont(font)
-        value_item.setFont(font)
-        
-        self.specs_table.setItem(row, 0, name_item)
-        self.specs_table.setItem(row, 1, value_item)
+    def _base_model(self):
+        """Get the model number of the current product, without its description."""
+        model = self.product_info.get("model", "")
+        return model.split(None, 1)[0] if model.strip() else ""
     
-    def update_pricing(self):
+    def update_pricing(self, options_price=None):
         """
         Update pricing calculations.
         
@@ -323,92 +535,31 @@ class QuoteTab(QWidget):
         and total price based on the current product and specifications.
         This is currently using placeholder calculations and would normally
         integrate with a proper pricing module.
-        """
-        # Base price based on product model
-        base_price = 0.0
-        model = self.product_info.get("model", "")
         
-        # Set base prices for each model
-        model_prices = {
-            "LS2000": 800.0,  # General Purpose
-            "LS2100": 700.0,  # Loop Powered
-            "LS6000": 900.0,  # Heavy Duty
-            "LS7000": 1200.0, # Advanced Features
-            "LS7000/2": 1500.0, # Dual Point
-            "LS8000": 1100.0, # Remote Mounted
-            "LS8000/2": 1400.0, # Remote Mounted Dual Point
-            "LT9000": 1800.0,  # Level Transmitter
-            "FS10000": 950.0   # Flow Switch
-        }
+        Does nothing if the product and specifications are unchanged since
+        the last calculation.
+        
+        Args:
+            options_price (float, optional): Price of the options in the current
+                specifications, if already calculated. Connection options are
+                added separately. Defaults to None, which prices the specs here.
+        """
+        pricing_key = (_freeze(self.product_info), _freeze(self.specs))
+        if pricing_key == self._last_pricing_key:
+            return
+        self._last_pricing_key = pricing_key
         
-        # Get base price for the model
-        base_model = model.split()[0]  # Get just the model number without description
-        base_price = model_prices.get(base_model, 0.0)
+        # Base price based on product model
+        base_model = self._base_model()
+        base_price = MODEL_PRICES.get(base_model, 0.0)
         
         # Options price based on specifications
-        options_price = 0.0
-        
-        # Add costs for each option
-        for name, value in self.specs.items():
-            # Material upgrades
-            if name == "material":
-                if "Hastelloy" in value:
-                    options_price += 400.0
-                elif "Aluminum" in value:
-                    options_price += 50.0
-                
-            # Exotic metals
-            if name == "exotic_metals":
-                if "Titanium" in value:
-                    options_price += 600.0
-                elif "Monel" in value:
-                    options_price += 500.0
-            
-            # Special O-rings
-            if name == "oring":
-                if "Kalrez" in value:
-                    options_price += 120.0
-                elif "PTFE" in value:
-                    options_price += 80.0
-                elif "EPDM" in value:
-                    options_price += 40.0
-            
-            # Housing options
-            if name == "housing":
-                if "Explosion-Proof" in value:
-                    options_price += 300.0
-                elif "Stainless Steel" in value:
-                    options_price += 200.0
-            
-            # Feature options
-            if name == "high_temp" and value:
-                options_price += 150.0
-            elif name == "extended_probe" and value:
-                options_price += 100.0
-            elif name == "remote_display" and value:
-                options_price += 250.0
-            
-            # Output type options (for transmitters)
-            if name == "output_type":
-                if "HART" in value:
-                    options_price += 300.0
-                elif "Modbus RTU" in value:
-                    options_price += 250.0
-                
-            # Length options
-            if name == "probe_length" and isinstance(value, (int, float)):
-                # Add cost for longer probes
-                standard_length = 10  # Standard length is 10" for most models
-                if base_model in ["LS2000", "LS2100"] and value > standard_length:
-                    options_price += (value - standard_length) * 8.0  # $8 per inch over standard
-                elif value > standard_length:
-                    options_price += (value - standard_length) * 12.0  # $12 per inch over standard for other models
-            
-            if name == "cable_length" and isinstance(value, (int, float)):
-                # Add cost for longer cables
-                standard_cable = 10  # Standard cable length is 10 feet
-                if value > standard_cable:
-                    options_price += (value - standard_cable) * 5.0  # $5 per foot over standard
+        if options_price is None:
+            options_price = 0.0
+            for name, value in self.specs.items():
+                option_price = OPTION_PRICERS.get(name)
+                if option_price:
+                    options_price += option_price(value, base_model)
         
         # Add connection option price
         db = SessionLocal()
@@ -444,31 +595,47 @@ class QuoteTab(QWidget):
         self.total_price_label.setText(f"${total_price:.2f}")
     
     def on_customer_info_changed(self):
-        """Handle changes to customer information."""
-        customer_data = {
-            "name": self.customer_name.text(),
-            "contact": self.contact_name.text(),
-            "email": self.email.text(),
-            "phone": self.phone.text(),
-            "notes": self.notes.toPlainText()
-        }
+        """
+        Handle changes to customer information.
         
-        # Emit signal with updated customer info
-        self.customer_updated.emit(customer_data)
+        Invalidates the cached customer information and restarts the update
+        timer so a burst of keystrokes results in a single customer_updated
+        emission.
+        """
+        self._customer_cache = None
+        self._customer_update_timer.start()
     
-    def get_quote_data(self):
-        """Get all data for the current quote."""
-        return {
-            "product": self.product_info,
-            "specifications": self.specs,
-            "pricing": self.pricing,
-            "customer": {
+    def _emit_customer_update(self):
+        """Emit customer_updated with the current customer information."""
+        self.customer_updated.emit(self.get_customer_info())
+    
+    def get_customer_info(self):
+        """
+        Get the customer information entered in the form.
+        
+        The fields are read once after each change and cached until the next
+        change.
+        
+        Returns:
+            dict: Customer name, contact, email, phone and notes
+        """
+        if self._customer_cache is None:
+            self._customer_cache = {
                 "name": self.customer_name.text(),
                 "contact": self.contact_name.text(),
                 "email": self.email.text(),
                 "phone": self.phone.text(),
                 "notes": self.notes.toPlainText()
             }
+        return self._customer_cache
+    
+    def get_quote_data(self):
+        """Get all data for the current quote."""
+        return {
+            "product": self.product_info,
+            "specifications": self.specs,
+            "pricing": self.pricing,
+            "customer": self.get_customer_info()
         }
 
     def add_spare_part_to_quote(self, part_info):
@@ -508,11 +675,8 @@ class QuoteTab(QWidget):
         total_price_item = QTableWidgetItem(f"${part_info['price']:.2f}")
         
         # Use standard font to avoid DirectWrite font issues
-        font = QFont("Arial", 9)
-        desc_item.setFont(font)
-        qty_item.setFont(font)
-        unit_price_item.setFont(font)
-        total_price_item.setFont(font)
+        for item in (desc_item, qty_item, unit_price_item, total_price_item):
+            item.setFont(self._item_font)
         
         self.items_table.setItem(row, 0, desc_item)
         self.items_table.setItem(row, 1, qty_item)
@@ -552,13 +716,9 @@ class QuoteTab(QWidget):
         self.pricing["total_price"] = total_price
         
         # Update UI with standard fonts
-        font = QFont("Arial", 9)
-        self.base_price_label.setFont(font)
-        self.options_price_label.setFont(font)
-        
-        bold_font = QFont("Arial", 10)
-        bold_font.setBold(True)
-        self.total_price_label.setFont(bold_font)
+        self.base_price_label.setFont(self._item_font)
+        self.options_price_label.setFont(self._item_font)
+        self.total_price_label.setFont(self._total_font)
         
         self.base_price_label.setText(f"${base_price:.2f}")
         self.options_price_label.setText(f"${options_price:.2f}")
@@ -16,16 +16,135 @@ based on product selection and database-driven options.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QComboBox, QGroupBox, QFormLayout, QSpacerItem,
-    QSizePolicy, QSlider, QSpinBox, QDoubleSpinBox,
+    QComboBox, QFormLayout, QSlider, QSpinBox, QDoubleSpinBox,
     QCheckBox, QScrollArea, QLineEdit, QPushButton
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QSignalBlocker, QTimer
 
 from src.core.database import SessionLocal
 from src.core.services.product_service import ProductService
 
 
+# Fixed choices for the specification combo boxes; voltages and materials
+# depend on the product family and come from the database
+CONNECTION_TYPES = ("NPT", "Flange", "Tri-Clamp")
+NPT_SIZES = ('1/2" NPT', '3/4" NPT', '1" NPT', '1.5" NPT', '2" NPT')
+FLANGE_RATINGS = ("150#", "300#")
+FLANGE_SIZES = ('1"', '1.5"', '2"', '3"', '4"')
+TRICLAMP_SIZES = ('1.5"', '2"')
+EXOTIC_METAL_OPTIONS = ("None", "T - Titanium", "U - Monel")
+ORING_MATERIALS = ("Viton", "PTFE", "Kalrez", "EPDM")
+HOUSING_TYPES = ("Standard", "Explosion-Proof", "Stainless Steel")
+OUTPUT_TYPES = ("4-20mA", "0-10V", "Modbus RTU", "HART")
+
+
+# Widgets are configured with their signals blocked, so setting up the initial
+# items and values never reaches a change handler
+def _combo(items):
+    """
+    Widget factory for a combo box.
+    
+    Args:
+        items: Tuple of options, or a callable taking the tab and returning them
+    """
+    def create(tab):
+        combo = QComboBox()
+        with QSignalBlocker(combo):
+            combo.addItems(items(tab) if callable(items) else items)
+        return combo
+    return create
+
+
+def _spin(minimum, maximum, value, suffix):
+    """Widget factory for a spin box with a range, default value and suffix."""
+    def create(tab):
+        spin = QSpinBox()
+        with QSignalBlocker(spin):
+            spin.setRange(minimum, maximum)
+            spin.setValue(value)
+            spin.setSuffix(suffix)
+        return spin
+    return create
+
+
+def _check(text):
+    """Widget factory for a check box."""
+    return lambda tab: QCheckBox(text)
+
+
+# Product categories that change which sections and options are shown
+PRODUCT_KINDS = ("Level Switch", "Transmitter", "Emissions")
+
+# Specification sections in display order:
+# section name -> (section header, rows). Each row is
+# (label, spec name, widget factory, kind); a row with a kind from PRODUCT_KINDS
+# is only built for products of that kind, and a row without a label spans the form.
+SECTION_SCHEMAS = {
+    "voltage": ("Voltage", (
+        ("Supply Voltage:", "voltage", _combo(lambda tab: tab._available_voltages()), None),
+    )),
+    "material": ("Material", (
+        ("Material:", "material", _combo(lambda tab: tab._available_materials()), None),
+    )),
+    "probe_length": ("Probe Length", (
+        ("Probe Length:", "probe_length", _spin(1, 120, 12, " inches"), None),
+    )),
+    "connection": ("Connection", (
+        ("Connection Type:", "connection_type", _combo(CONNECTION_TYPES), None),
+        ("NPT Size:", "npt_size", _combo(NPT_SIZES), None),
+        ("Flange Rating:", "flange_rating", _combo(FLANGE_RATINGS), None),
+        ("Flange Size:", "flange_size", _combo(FLANGE_SIZES), None),
+        ("Tri-Clamp Size:", "triclamp_size", _combo(TRICLAMP_SIZES), None),
+    )),
+    "exotic_metals": ("Exotic Metals", (
+        ("Exotic Metal Option:", "exotic_metals", _combo(EXOTIC_METAL_OPTIONS), None),
+    )),
+    "oring": ("O-ring Material", (
+        ("O-ring Material:", "oring", _combo(ORING_MATERIALS), None),
+    )),
+    "cable_length": ("Cable Length", (
+        ("Cable Length:", "cable_length", _spin(0, 100, 10, " feet"), None),
+    )),
+    "housing": ("Housing Type", (
+        ("Housing Type:", "housing", _combo(HOUSING_TYPES), None),
+    )),
+    "additional_options": ("Additional Options", (
+        (None, "high_temp", _check("High Temperature Version"), None),
+        (None, "extended_probe", _check("Extended Probe"), "Level Switch"),
+        (None, "remote_display", _check("Remote Display Option"), "Transmitter"),
+        ("Output Type:", "output_type", _combo(OUTPUT_TYPES), "Transmitter"),
+    )),
+}
+
+# Change signal and value getter for each type of specification widget
+SPEC_WIDGET_BINDINGS = (
+    (QComboBox, "currentIndexChanged", QComboBox.currentText),
+    ((QSpinBox, QDoubleSpinBox), "valueChanged", lambda widget: widget.value()),
+    (QSlider, "valueChanged", QSlider.value),
+    (QCheckBox, "stateChanged", QCheckBox.isChecked),
+    (QLineEdit, "textChanged", QLineEdit.text),
+)
+
+
+def _spec_widget_binding(widget):
+    """
+    Get the change signal name and value getter for a specification widget.
+    
+    Args:
+        widget (QWidget): Specification input widget
+        
+    Returns:
+        tuple: (signal name, getter taking the widget and returning its value)
+        
+    Raises:
+        ValueError: If the widget type is not a supported input widget
+    """
+    for widget_types, signal_name, getter in SPEC_WIDGET_BINDINGS:
+        if isinstance(widget, widget_types):
+            return signal_name, getter
+    raise ValueError(f"Unsupported specification widget: {type(widget).__name__}")
+
+
 class SpecificationsTab(QWidget):
     """
     Specifications configuration tab for the quote generator.
@@ -47,7 +166,7 @@ class SpecificationsTab(QWidget):
         product_service (ProductService): Service for product data access
         scroll (QScrollArea): Scrollable container for specifications
         scroll_content (QWidget): Container for specification sections
-        specs_layout (QVBoxLayout): Layout manager for specifications
+        specs_layout (QFormLayout): Form holding the rows of every shown section
         add_to_quote_button (QPushButton): Button to add configured product to quote
     
     Signals:
@@ -59,6 +178,9 @@ class SpecificationsTab(QWidget):
     specs_updated = Signal(dict)  # specifications dictionary
     add_to_quote = Signal(dict)  # Signal to add current specs to quote
     
+    # Idle time after the last widget change before specs_updated is emitted
+    SPECS_UPDATE_DELAY_MS = 50
+    
     def __init__(self, parent=None):
         """
         Initialize the SpecificationsTab.
@@ -69,9 +191,36 @@ class SpecificationsTab(QWidget):
         super().__init__(parent)
         self.init_ui()
         self.current_product = None
+        self._product_family = None  # e.g. "LS2000" for "LS2000 General Purpose"
+        self._product_kinds = frozenset()  # PRODUCT_KINDS in the product category
         self.specs_widgets = {}  # Store references to specification widgets
         self.product_service = ProductService()
         
+        # Built sections, reused whenever a product needs the same section:
+        # section key -> (form rows, ((spec name, widget, value getter), ...),
+        #                 callable re-applying field visibility or None)
+        self._section_cache = {}
+        self._spec_entries = []  # (spec name, widget, value getter) shown on the form
+        self._specs_cache = {}  # Spec name -> value of the widgets shown on the form
+        
+        # Holding a spin box arrow or typing emits specs_updated once per pause
+        self._specs_update_timer = QTimer(self)
+        self._specs_update_timer.setSingleShot(True)
+        self._specs_update_timer.setInterval(self.SPECS_UPDATE_DELAY_MS)
+        self._specs_update_timer.timeout.connect(self._emit_specs_update)
+        self._last_specs = None  # Specifications last emitted or taken
+        
+        # Sections shown after the first EAGER_SECTION_COUNT that still have to
+        # be built, mounted one per event loop turn: [(section, key), ...]
+        self._pending_sections = []
+        self._mount_timer = QTimer(self)
+        self._mount_timer.setSingleShot(True)
+        self._mount_timer.setInterval(0)
+        self._mount_timer.timeout.connect(self._mount_next_section)
+        
+        self._header_label = None
+        self._updating = False  # True while sections are being shown or reset
+        
     def init_ui(self):
         """
         Initialize the UI components.
@@ -86,14 +235,16 @@ class SpecificationsTab(QWidget):
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
         self.scroll_content = QWidget()
-        self.specs_layout = QVBoxLayout(self.scroll_content)
+        # One form for all sections, each introduced by a header row, rather
+        # than a group box and nested layout per section
+        self.specs_layout = QFormLayout(self.scroll_content)
         
         # Placeholder text when no product is selected
         self.placeholder_label = QLabel(
             "Please select a product in the Product Selection tab to configure specifications."
         )
         self.placeholder_label.setAlignment(Qt.AlignCenter)
-        self.specs_layout.addWidget(self.placeholder_label)
+        self.specs_layout.addRow(self.placeholder_label)
         
         self.scroll.setWidget(self.scroll_content)
         main_layout.addWidget(self.scroll)
@@ -117,12 +268,22 @@ class SpecificationsTab(QWidget):
         self.add_to_quote_button.setEnabled(False)  # Initially disabled until product is selected
         main_layout.addWidget(self.add_to_quote_button)
     
+    # Specification sections in display order
+    SECTIONS = tuple(SECTION_SCHEMAS)
+    
+    # Sections built before the form is shown; any later ones that still need
+    # building are mounted after it is painted
+    EAGER_SECTION_COUNT = 3
+    
     def update_for_product(self, category, model):
         """
         Update specifications form for a newly selected product.
         
-        Clears existing specifications and rebuilds the form with
-        options appropriate for the selected product category and model.
+        Shows the sections appropriate for the selected product category and
+        model, in standard order. Sections are built the first time they are
+        needed and reused afterwards, with their values reset to defaults.
+        Sections below the first EAGER_SECTION_COUNT are mounted on later
+        event loop turns if any of them still has to be built.
         
         Args:
             category (str): Product category (e.g., "Level Switch")
@@ -130,8 +291,35 @@ class SpecificationsTab(QWidget):
         """
         self.current_product = {"category": category, "model": model}
         
-        # Clear existing specs
-        self.clear_specifications()
+        # Worked out once here rather than by every section key and builder
+        self._product_family = model.split()[0]
+        self._product_kinds = frozenset(
+            kind for kind in PRODUCT_KINDS if kind in category
+        )
+        
+        # Rearrange the form with painting off, so it repaints once at the end,
+        # and without emitting specs_updated for the values being reset
+        self.scroll_content.setUpdatesEnabled(False)
+        self._updating = True
+        try:
+            self._show_sections_for_product(model)
+        finally:
+            self._updating = False
+            self.scroll_content.setUpdatesEnabled(True)
+        self.scroll_content.updateGeometry()
+        
+        # Enable add to quote button
+        self.add_to_quote_button.setEnabled(True)
+    
+    def _show_sections_for_product(self, model):
+        """
+        Replace the sections on the form with those for the current product.
+        
+        Args:
+            model (str): Product model number
+        """
+        # Take the current sections off the form
+        self._hide_all_sections()
         
         # Remove placeholder
         if self.placeholder_label:
@@ -139,307 +327,309 @@ class SpecificationsTab(QWidget):
             self.placeholder_label = None
         
         # Add header
-        header = QLabel(f"<h3>Specifications for {model}</h3>")
-        header.setAlignment(Qt.AlignCenter)
-        self.specs_layout.addWidget(header)
+        if self._header_label is None:
+            self._header_label = QLabel()
+            self._header_label.setAlignment(Qt.AlignCenter)
+        self._header_label.setText(f"<h3>Specifications for {model}</h3>")
+        self.specs_layout.addRow(self._header_label)
+        self._header_label.setVisible(True)
         
         # Add specification sections in standard order
-        self.add_voltage_section()
-        self.add_material_section()
-        self.add_probe_length_section()
-        self.add_connection_section()
-        self.add_exotic_metals_section()
-        self.add_oring_section()
-        self.add_cable_length_section()
-        self.add_housing_section()
-        self.add_additional_options_section()
-            
-        # Add spacer at the bottom
-        self.specs_layout.addItem(
-            QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
-        )
-        
-        # Connect change signals for all widgets
-        for widget_name, widget in self.specs_widgets.items():
-            if isinstance(widget, QComboBox):
-                widget.currentIndexChanged.connect(self.on_specs_changed)
-            elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                widget.valueChanged.connect(self.on_specs_changed)
-            elif isinstance(widget, QCheckBox):
-                widget.stateChanged.connect(self.on_specs_changed)
-            elif isinstance(widget, QSlider):
-                widget.valueChanged.connect(self.on_specs_changed)
-        
-        # Enable add to quote button
-        self.add_to_quote_button.setEnabled(True)
+        sections = []
+        for section in self.SECTIONS:
+            key = self._section_key(section)
+            if key is not None:
+                sections.append((section, key))
+        eager = sections[:self.EAGER_SECTION_COUNT]
+        rest = sections[self.EAGER_SECTION_COUNT:]
+        
+        for section, key in eager:
+            self._show_section(section, key)
+        
+        # Show the rest now if they are all built; otherwise mount them in
+        # order once the first sections have been painted
+        self._mount_timer.stop()
+        if all(key in self._section_cache for _, key in rest):
+            self._pending_sections = []
+            for section, key in rest:
+                self._show_section(section, key)
+        else:
+            self._pending_sections = rest
+            self._mount_timer.start()
     
-    def add_voltage_section(self):
+    def _show_section(self, section, key):
         """
-        Add voltage selection section to the specifications form.
+        Show a section on the form, building it if it is not cached.
+        
+        A cached section is reset to its default values.
         
-        Creates a group box with voltage options appropriate for the
-        current product, fetching available options from the database.
+        Args:
+            section (str): Section name from SECTIONS
+            key (tuple): Cache key of the section for the current product
         """
-        group = QGroupBox("Voltage")
-        layout = QFormLayout()
+        cached = self._section_cache.get(key)
+        if cached is None:
+            rows, widgets, refresh = self._build_section(section)
+            cached = (rows, self._register_section(widgets), refresh)
+            self._section_cache[key] = cached
+        else:
+            for name, widget, _ in cached[1]:
+                self._reset_widget(name, widget)
+        
+        rows, entries, refresh = cached
+        for label, field in rows:
+            if label is None:
+                self.specs_layout.addRow(field)
+            else:
+                self.specs_layout.addRow(label, field)
+                label.setVisible(True)
+            field.setVisible(True)
+        if refresh is not None:
+            refresh()
+        self._spec_entries.extend(entries)
+        for name, widget, getter in entries:
+            self.specs_widgets[name] = widget
+            self._specs_cache[name] = getter(widget)
+    
+    @Slot()
+    def _mount_next_section(self):
+        """Mount the next pending section, then schedule the one after it."""
+        if not self._pending_sections:
+            return
+        section, key = self._pending_sections.pop(0)
         
-        voltage = QComboBox()
+        self._updating = True
+        try:
+            self._show_section(section, key)
+        finally:
+            self._updating = False
         
-        # Get available voltages for the current product family
-        if self.current_product and "model" in self.current_product:
-            product_family = self.current_product["model"].split()[0]
-            
-            db = SessionLocal()
-            try:
-                available_voltages = self.product_service.get_available_voltages(db, product_family)
-                voltage.addItems(available_voltages)
-            finally:
-                db.close()
+        if self._pending_sections:
+            self._mount_timer.start()
+    
+    def _mount_pending_sections(self):
+        """Mount all pending sections now, so every spec is on the form."""
+        self._mount_timer.stop()
+        while self._pending_sections:
+            self._mount_next_section()
+        self._mount_timer.stop()
+    
+    def _section_key(self, section):
+        """
+        Get the cache key of a section for the current product.
         
-        layout.addRow("Supply Voltage:", voltage)
-        self.specs_widgets["voltage"] = voltage
+        Sections whose options depend on the product family or category are
+        cached separately for each family or category combination.
         
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
+        Args:
+            section (str): Section name from SECTIONS
+            
+        Returns:
+            tuple: Cache key, or None if the current product has no such section
+        """
+        kinds = self._product_kinds
+        if section in ("voltage", "material"):
+            return (section, self._product_family)
+        if section in ("probe_length", "oring"):
+            # Emission monitoring products have no probe or O-rings
+            return None if "Emissions" in kinds else (section,)
+        if section == "additional_options":
+            return (section, "Level Switch" in kinds, "Transmitter" in kinds)
+        return (section,)
     
-    def add_material_section(self):
+    def _register_section(self, widgets):
         """
-        Add material selection section to the specifications form.
+        Connect the change signals of a newly built section's widgets.
         
-        Creates a group box with material options appropriate for the
-        current product, fetching available options from the database.
+        The signal and value getter for each widget are looked up from its
+        type once, here. A change then updates only that widget's entry in
+        the specifications cache.
+        
+        Args:
+            widgets (dict): Spec name -> widget for the section
+            
+        Returns:
+            tuple: (spec name, widget, value getter) for each widget
+        """
+        entries = []
+        # The widgets live in the tab's thread, so changes are handled
+        # directly rather than through AutoConnection's per-emit thread check
+        on_spec_changed = self._on_spec_changed
+        for name, widget in widgets.items():
+            signal_name, getter = _spec_widget_binding(widget)
+            getattr(widget, signal_name).connect(
+                lambda *args, slot=on_spec_changed, name=name, widget=widget, getter=getter:
+                    slot(name, widget, getter),
+                Qt.DirectConnection,
+            )
+            entries.append((name, widget, getter))
+        return tuple(entries)
+    
+    def _build_section(self, section):
         """
-        group = QGroupBox("Material")
-        layout = QFormLayout()
+        Build a section from its entry in SECTION_SCHEMAS.
         
-        material = QComboBox()
+        The section starts with a header row. Rows limited to a product kind
+        are only built for products of that kind. A section with a
+        ``_setup_{section}_section`` method gets it called with the built
+        widgets.
         
-        if self.current_product and "model" in self.current_product:
-            product_family = self.current_product["model"].split()[0]
+        Args:
+            section (str): Section name from SECTIONS
             
-            db = SessionLocal()
-            try:
-                available_materials = self.product_service.get_available_materials_for_product(db, product_family)
-                material.addItems([m['display_name'] for m in available_materials])
-            finally:
-                db.close()
+        Returns:
+            tuple: (form rows as (label or None, field widget),
+                    dict of spec name -> widget,
+                    callable re-applying field visibility or None)
+        """
+        title, rows = SECTION_SCHEMAS[section]
+        kinds = self._product_kinds
+        header = QLabel(title)
+        header.setObjectName("section_header")
+        form_rows = [(None, header)]
+        widgets = {}
+        
+        for label, name, create, kind in rows:
+            if kind is not None and kind not in kinds:
+                continue
+            widget = create(self)
+            if label is not None:
+                label = QLabel(label)
+                label.setBuddy(widget)
+            form_rows.append((label, widget))
+            widgets[name] = widget
+        
+        setup = getattr(self, f"_setup_{section}_section", None)
+        refresh = setup(widgets) if setup is not None else None
+        return tuple(form_rows), widgets, refresh
+    
+    def _setup_connection_section(self, widgets):
+        """
+        Show only the size fields that apply to the selected connection type.
         
-        layout.addRow("Material:", material)
-        self.specs_widgets["material"] = material
+        Args:
+            widgets (dict): Spec name -> widget for the connection section
+            
+        Returns:
+            callable: Re-applies the field visibility when the section is shown
+        """
+        connection_type = widgets["connection_type"]
+        fields = {
+            "NPT": (widgets["npt_size"],),
+            "Flange": (widgets["flange_rating"], widgets["flange_size"]),
+            "Tri-Clamp": (widgets["triclamp_size"],),
+        }
         
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
+        def update_connection_fields():
+            selected = connection_type.currentText()
+            for connection, connection_fields in fields.items():
+                for field in connection_fields:
+                    field.setVisible(connection == selected)
+        connection_type.currentIndexChanged.connect(
+            update_connection_fields, Qt.DirectConnection
+        )
+        return update_connection_fields
+    
+    def _available_voltages(self):
+        """Get the supply voltages offered for the current product family."""
+        if self._product_family is None:
+            return []
+        db = SessionLocal()
+        try:
+            return self.product_service.get_available_voltages(
+                db, self._product_family
+            )
+        finally:
+            db.close()
     
-    def add_probe_length_section(self):
+    def _available_materials(self):
+        """Get the material names offered for the current product family."""
+        if self._product_family is None:
+            return []
+        db = SessionLocal()
+        try:
+            materials = self.product_service.get_available_materials_for_product(
+                db, self._product_family
+            )
+            return [m['display_name'] for m in materials]
+        finally:
+            db.close()
+    
+    @Slot()
+    def on_specs_changed(self):
         """
-        Add probe length configuration section to the specifications form.
+        Handle changes to specification values.
         
-        Creates a group box with probe length options. Only added for
-        products that have probes (skipped for emission monitoring products).
+        Restarts the update timer so a burst of changes results in a single
+        specs_updated emission.
         """
-        if "Emissions" in self.current_product.get("category", ""):
+        # Sections being reset while the form is updated for a new product
+        if self._updating:
             return
-            
-        group = QGroupBox("Probe Length")
-        layout = QFormLayout()
-        
-        probe_length = QSpinBox()
-        probe_length.setRange(1, 120)
-        probe_length.setValue(12)
-        probe_length.setSuffix(" inches")
-        layout.addRow("Probe Length:", probe_length)
-        self.specs_widgets["probe_length"] = probe_length
         
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
+        self._specs_update_timer.start()
     
-    def add_connection_section(self):
+    def _on_spec_changed(self, name, widget, getter):
         """
-        Add connection configuration section to the specifications form.
-        
-        Creates a group box with connection options including:
-        - Connection type (NPT, Flange, Tri-Clamp)
-        - Size options for each connection type
-        - Flange ratings when applicable
+        Record the new value of a changed specification widget.
         
-        The visible options update dynamically based on the selected
-        connection type.
+        Args:
+            name (str): Spec name of the widget
+            widget (QWidget): The widget that changed
+            getter (callable): Reads the widget's value
         """
-        group = QGroupBox("Connection")
-        layout = QFormLayout()
-
-        # Connection type selection
-        connection_type = QComboBox()
-        connection_type.addItems(["NPT", "Flange", "Tri-Clamp"])
-        layout.addRow("Connection Type:", connection_type)
-        self.specs_widgets["connection_type"] = connection_type
-
-        # NPT size selection
-        npt_size = QComboBox()
-        npt_size.addItems(["1/2\" NPT", "3/4\" NPT", "1\" NPT", "1.5\" NPT", "2\" NPT"])
-        layout.addRow("NPT Size:", npt_size)
-        self.specs_widgets["npt_size"] = npt_size
-
-        # Flange rating and size
-        flange_rating = QComboBox()
-        flange_rating.addItems(["150#", "300#"])
-        layout.addRow("Flange Rating:", flange_rating)
-        self.specs_widgets["flange_rating"] = flange_rating
-
-        flange_size = QComboBox()
-        flange_size.addItems(['1"', '1.5"', '2"', '3"', '4"'])
-        layout.addRow("Flange Size:", flange_size)
-        self.specs_widgets["flange_size"] = flange_size
-
-        # Tri-Clamp size
-        triclamp_size = QComboBox()
-        triclamp_size.addItems(['1.5"', '2"'])
-        layout.addRow("Tri-Clamp Size:", triclamp_size)
-        self.specs_widgets["triclamp_size"] = triclamp_size
-
-        # Show/hide widgets based on connection type
-        def update_connection_fields():
-            if connection_type.currentText() == "NPT":
-                npt_size.show()
-                flange_rating.hide()
-                flange_size.hide()
-                triclamp_size.hide()
-            elif connection_type.currentText() == "Flange":
-                npt_size.hide()
-                flange_rating.show()
-                flange_size.show()
-                triclamp_size.hide()
-            elif connection_type.currentText() == "Tri-Clamp":
-                npt_size.hide()
-                flange_rating.hide()
-                flange_size.hide()
-                triclamp_size.show()
-        connection_type.currentIndexChanged.connect(update_connection_fields)
-        update_connection_fields()
-
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
+        # Ignore widgets of sections that are not on the form
+        if self.specs_widgets.get(name) is not widget:
+            return
+        self._specs_cache[name] = getter(widget)
+        self.on_specs_changed()
     
-    def add_exotic_metals_section(self):
-        """
-        Add exotic metals selection section to the specifications form.
-        
-        Creates a group box for selecting exotic metal options when
-        available for the current product.
+    @Slot()
+    def _emit_specs_update(self):
+        """Emit specs_updated with all current specification values, if changed."""
+        specs = self._take_changed_specs()
+        if specs is not None:
+            self.specs_updated.emit(specs)
+    
+    def take_pending_specs(self):
         """
-        group = QGroupBox("Exotic Metals")
-        layout = QFormLayout()
+        Cancel a pending specs_updated emission.
         
-        exotic_metals = QComboBox()
-        exotic_metals.addItems(["None", "T - Titanium", "U - Monel"])
-        layout.addRow("Exotic Metal Option:", exotic_metals)
-        self.specs_widgets["exotic_metals"] = exotic_metals
+        Lets a caller that needs the latest specifications right away apply
+        them itself instead of waiting for the update timer.
         
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
+        Returns:
+            dict: Current specifications if an emission was pending and they
+                  differ from the last ones emitted or taken, else None
+        """
+        if not self._specs_update_timer.isActive():
+            return None
+        self._specs_update_timer.stop()
+        return self._take_changed_specs()
     
-    def add_oring_section(self):
-        """Add O-ring material section."""
-        # Skip for products without O-rings
-        if "Emissions" in self.current_product.get("category", ""):
-            return
-            
-        group = QGroupBox("O-ring Material")
-        layout = QFormLayout()
-        
-        oring = QComboBox()
-        oring.addItems(["Viton", "PTFE", "Kalrez", "EPDM"])
-        layout.addRow("O-ring Material:", oring)
-        self.specs_widgets["oring"] = oring
-        
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
-    
-    def add_cable_length_section(self):
-        """Add cable length section."""
-        group = QGroupBox("Cable Length")
-        layout = QFormLayout()
-        
-        cable_length = QSpinBox()
-        cable_length.setRange(0, 100)
-        cable_length.setValue(10)
-        cable_length.setSuffix(" feet")
-        layout.addRow("Cable Length:", cable_length)
-        self.specs_widgets["cable_length"] = cable_length
-        
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
-    
-    def add_housing_section(self):
-        """Add housing type section."""
-        group = QGroupBox("Housing Type")
-        layout = QFormLayout()
-        
-        housing = QComboBox()
-        housing.addItems(["Standard", "Explosion-Proof", "Stainless Steel"])
-        layout.addRow("Housing Type:", housing)
-        self.specs_widgets["housing"] = housing
-        
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
-    
-    def add_additional_options_section(self):
-        """Add additional options section."""
-        group = QGroupBox("Additional Options")
-        layout = QVBoxLayout()
-        
-        # Common options for most products
-        high_temp = QCheckBox("High Temperature Version")
-        layout.addWidget(high_temp)
-        self.specs_widgets["high_temp"] = high_temp
-        
-        # Product-specific options
-        if "Level Switch" in self.current_product.get("category", ""):
-            extended_probe = QCheckBox("Extended Probe")
-            layout.addWidget(extended_probe)
-            self.specs_widgets["extended_probe"] = extended_probe
-        
-        if "Transmitter" in self.current_product.get("category", ""):
-            remote_display = QCheckBox("Remote Display Option")
-            layout.addWidget(remote_display)
-            self.specs_widgets["remote_display"] = remote_display
-            
-            output_type = QComboBox()
-            output_type.addItems(["4-20mA", "0-10V", "Modbus RTU", "HART"])
-            layout.addWidget(QLabel("Output Type:"))
-            layout.addWidget(output_type)
-            self.specs_widgets["output_type"] = output_type
+    def _take_changed_specs(self):
+        """
+        Get the current specifications if they changed since last handed out.
         
-        group.setLayout(layout)
-        self.specs_layout.addWidget(group)
-    
-    def on_specs_changed(self):
-        """Handle changes to specification values."""
-        # Get all current specification values
-        specs = self.get_specifications()
+        Edits that end where they started, such as a value changed and changed
+        back within the update delay, leave the specifications as they were
+        and are not passed on.
         
-        # Emit signal with updated specifications
-        self.specs_updated.emit(specs)
+        Returns:
+            dict: Current specifications, or None if unchanged
+        """
+        specs = self.get_specifications()
+        if specs == self._last_specs:
+            return None
+        self._last_specs = dict(specs)
+        return specs
     
     def get_specifications(self):
         """Get all current specification values."""
-        specs = {}
-        
-        # Extract values from all specification widgets
-        for name, widget in self.specs_widgets.items():
-            if isinstance(widget, QComboBox):
-                specs[name] = widget.currentText()
-            elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                specs[name] = widget.value()
-            elif isinstance(widget, QSlider):
-                specs[name] = widget.value()
-            elif isinstance(widget, QCheckBox):
-                specs[name] = widget.isChecked()
-            elif isinstance(widget, QLineEdit):
-                specs[name] = widget.text()
-        
-        return specs 
+        self._mount_pending_sections()
+        return dict(self._specs_cache)
     
+    @Slot()
     def on_add_to_quote(self):
         """Handle add to quote button click."""
         # Get the current specifications
@@ -455,23 +645,9 @@ class SpecificationsTab(QWidget):
         """Reset all specifications to their default values."""
         try:
             # Reset all widgets to default values
+            self._mount_pending_sections()
             for name, widget in self.specs_widgets.items():
-                if isinstance(widget, QComboBox):
-                    widget.setCurrentIndex(0)  # Set to first item
-                elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                    if "length" in name:
-                        if name == "probe_length":
-                            widget.setValue(12)  # Default probe length
-                        elif name == "cable_length":
-                            widget.setValue(10)  # Default cable length
-                        else:
-                            widget.setValue(widget.minimum())  # Set to minimum value
-                    else:
-                        widget.setValue(widget.minimum())  # Set to minimum value
-                elif isinstance(widget, QCheckBox):
-                    widget.setChecked(False)  # Uncheck
-                elif isinstance(widget, QSlider):
-                    widget.setValue(widget.minimum())  # Set to minimum value
+                self._reset_widget(name, widget)
             
             # Emit signal with updated specifications
             self.on_specs_changed()
@@ -480,13 +656,42 @@ class SpecificationsTab(QWidget):
         except Exception as e:
             print(f"Error resetting specifications: {e}")
     
-    def clear_specifications(self):
-        """Clear all specification widgets."""
-        # Delete all widgets in the specs layout
-        while self.specs_layout.count():
-            item = self.specs_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def _reset_widget(self, name, widget):
+        """
+        Reset a specification widget to its default value.
         
-        # Clear the specs widgets dictionary
-        self.specs_widgets.clear() 
\ No newline at end of file
+        Args:
+            name (str): Spec name of the widget
+            widget (QWidget): Specification input widget
+        """
+        if isinstance(widget, QComboBox):
+            widget.setCurrentIndex(0)  # Set to first item
+        elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+            if name == "probe_length":
+                widget.setValue(12)  # Default probe length
+            elif name == "cable_length":
+                widget.setValue(10)  # Default cable length
+            else:
+                widget.setValue(widget.minimum())  # Set to minimum value
+        elif isinstance(widget, QCheckBox):
+            widget.setChecked(False)  # Uncheck
+        elif isinstance(widget, QSlider):
+            widget.setValue(widget.minimum())  # Set to minimum value
+    
+    def _hide_all_sections(self):
+        """
+        Take every section off the specifications form.
+        
+        Sections are hidden and kept in the section cache rather than deleted,
+        so the next product that needs them can show them again.
+        """
+        while self.specs_layout.rowCount():
+            row = self.specs_layout.takeRow(0)
+            for item in (row.labelItem, row.fieldItem):
+                if item is not None and item.widget():
+                    item.widget().setVisible(False)
+        
+        # Clear the specs widgets shown on the form
+        self.specs_widgets.clear()
+        self._spec_entries.clear()
+        self._specs_cache.clear()
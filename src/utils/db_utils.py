@@ -29,8 +29,8 @@ def add_all_and_commit(db: Session, objects: List[T]) -> List[T]:
 
 
 def get_by_id(db: Session, model: Type[T], id: int) -> Optional[T]:
-    """Get object by ID."""
-    return db.query(model).filter(model.id == id).first()
+    """Get object by ID, from the session's identity map when already loaded."""
+    return db.get(model, id)
 
 
 def get_all(db: Session, model: Type[T], **kwargs) -> List[T]:
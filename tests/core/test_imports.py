@@ -1,6 +1,9 @@
 """
 Tests for verifying required imports are available
 """
+import subprocess
+import sys
+
 import pytest
 
 @pytest.mark.parametrize("module_name", [
@@ -24,4 +27,13 @@ def test_base_imports(module_name):
 ])
 def test_application_imports(module_name):
     """Test that application modules can be imported"""
-    __import__(module_name) 
\ No newline at end of file
+    __import__(module_name) 
+
+def test_tab_import_does_not_load_main_window():
+    """Test that importing a tab module leaves the main window unloaded"""
+    code = (
+        "import sys, src.ui.specifications_tab, src.ui\n"
+        "assert 'src.ui.main_window' not in sys.modules\n"
+        "assert src.ui.MainWindow.__name__ == 'MainWindow'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,5 +1,13 @@
 import pytest
-from src.core.pricing import calculate_option_price, get_connection_option_price, calculate_product_price
+from decimal import Decimal
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.orm import sessionmaker
+from src.core.database import Base
+from src.core.models import Material, MaterialAvailability, Product, StandardLength
+from src.core.pricing import (
+    calculate_option_price, get_connection_option_price, calculate_product_price, calculate_product_prices,
+    clear_reference_data_cache, price_product, round_price
+)
 from unittest.mock import MagicMock, patch
 
 def test_calculate_option_price_fixed():
@@ -56,77 +64,268 @@ def test_get_connection_option_price_unknown_type():
     specs = {"connection_type": "Unknown"}
     assert get_connection_option_price(db, specs) == 0.0
 
-def make_product(base_price=100.0, base_length=24, material="S", model_number="LS2000", voltage="115VAC"):
-    product = MagicMock()
-    product.base_price = base_price
-    product.base_length = base_length
-    product.material = material
-    product.model_number = model_number
-    product.voltage = voltage
+@pytest.fixture
+def db():
+    """In-memory database session for product pricing tests."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    clear_reference_data_cache()
+    yield session
+    session.close()
+    clear_reference_data_cache()
+    engine.dispose()
+
+def make_product(db, base_price=100.0, base_length=24, material="S", model_number="LS2000", voltage="115VAC"):
+    product = Product(
+        base_price=base_price,
+        base_length=base_length,
+        material=material,
+        model_number=model_number,
+        voltage=voltage
+    )
+    db.add(product)
+    db.commit()
     return product
 
-def make_material(code="S", has_nonstandard_length_surcharge=False, nonstandard_length_surcharge=0.0):
-    material = MagicMock()
-    material.code = code
-    material.has_nonstandard_length_surcharge = has_nonstandard_length_surcharge
-    material.nonstandard_length_surcharge = nonstandard_length_surcharge
+def make_material(db, code="S", has_nonstandard_length_surcharge=False, nonstandard_length_surcharge=0.0):
+    material = Material(
+        code=code,
+        name=code,
+        base_length=10.0,
+        has_nonstandard_length_surcharge=has_nonstandard_length_surcharge,
+        nonstandard_length_surcharge=nonstandard_length_surcharge
+    )
+    db.add(material)
+    db.commit()
     return material
 
-def test_calculate_product_price_basic():
-    db = MagicMock()
-    product = make_product()
-    material = make_material()
-    db.query().filter().first.side_effect = [product, material]
-    result = calculate_product_price(db, 1)
+def test_calculate_product_price_basic(db):
+    product = make_product(db)
+    make_material(db)
+    result = calculate_product_price(db, product.id)
     assert result == product.base_price
 
-def test_calculate_product_price_product_not_found():
-    db = MagicMock()
-    db.query().filter().first.return_value = None
+def test_calculate_product_price_product_not_found(db):
     with pytest.raises(ValueError, match="Product with ID 1 not found"):
         calculate_product_price(db, 1)
 
-def test_calculate_product_price_material_not_found():
-    db = MagicMock()
-    product = make_product()
-    db.query().filter().first.side_effect = [product, None]
+def test_calculate_product_price_material_not_found(db):
+    product = make_product(db)
     with pytest.raises(ValueError, match="Material S not found"):
-        calculate_product_price(db, 1)
+        calculate_product_price(db, product.id)
 
-def test_calculate_product_price_material_unavailable():
-    db = MagicMock()
-    product = make_product()
-    material = make_material(code="H")
-    # Product, material, then None for MaterialAvailability
-    db.query().filter().first.side_effect = [product, material, None]
+def test_calculate_product_price_material_unavailable(db):
+    product = make_product(db)
+    make_material(db, code="H")
+    # No MaterialAvailability record for H
     with pytest.raises(ValueError, match="Material H is not available"):
-        calculate_product_price(db, 1, material_override="H")
+        calculate_product_price(db, product.id, material_override="H")
 
-def test_calculate_product_price_length_adjustment():
-    db = MagicMock()
-    product = make_product(base_length=24, material="S")
-    material = make_material(code="S")
-    db.query().filter().first.side_effect = [product, material]
+def test_calculate_product_price_material_available_for_model_prefix(db):
+    product = make_product(db, model_number="LS7000/2-115VAC-S-10")
+    make_material(db, code="H")
+    db.add(MaterialAvailability(material_code="H", product_type="LS7000/2", is_available=True))
+    db.commit()
+    result = calculate_product_price(db, product.id, material_override="H")
+    assert result == product.base_price
+
+def test_calculate_product_price_length_adjustment(db):
+    product = make_product(db, base_length=24, material="S")
+    make_material(db, code="S")
     # Length > base_length, S material: $3.75/inch
-    result = calculate_product_price(db, 1, length=36)
+    result = calculate_product_price(db, product.id, length=36)
     assert result == product.base_price + (36-24)*3.75
 
-def test_calculate_product_price_nonstandard_length_surcharge():
-    db = MagicMock()
-    product = make_product(base_length=24, material="S")
-    material = make_material(code="S", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=50.0)
-    # Product, material, is_standard=False
-    db.query().filter().first.side_effect = [product, material, None]
+def test_calculate_product_price_nonstandard_length_surcharge(db):
+    product = make_product(db, base_length=24, material="S")
+    make_material(db, code="S", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=50.0)
+    # No StandardLength record, so 30" is non-standard
     # Length > base_length, so length adder applies: (30-24)*3.75 = 22.5
     expected = product.base_price + (30-24)*3.75 + 50.0
-    result = calculate_product_price(db, 1, length=30)
+    result = calculate_product_price(db, product.id, length=30)
     assert result == expected
 
-def test_calculate_product_price_with_specs_adds_connection_price():
-    db = MagicMock()
-    product = make_product()
-    material = make_material()
-    db.query().filter().first.side_effect = [product, material]
+def test_calculate_product_price_standard_length_no_surcharge(db):
+    product = make_product(db, base_length=24, material="S")
+    make_material(db, code="S", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=50.0)
+    db.add(StandardLength(material_code="S", length=30.0))
+    db.commit()
+    result = calculate_product_price(db, product.id, length=30)
+    assert result == product.base_price + (30-24)*3.75
+
+def test_calculate_product_price_with_specs_adds_connection_price(db):
+    product = make_product(db)
+    make_material(db)
     with patch("src.core.pricing.get_connection_option_price", return_value=25.0):
-        result = calculate_product_price(db, 1, specs={"connection_type": "Flange"})
-        assert result == product.base_price + 25.0 
\ No newline at end of file
+        result = calculate_product_price(db, product.id, specs={"connection_type": "Flange"})
+        assert result == product.base_price + 25.0
+
+def test_calculate_product_prices_matches_single_pricing(db):
+    product = make_product(db, base_length=24, material="S")
+    make_material(db, code="S")
+    make_material(db, code="H", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=300.0)
+    db.add(MaterialAvailability(material_code="H", product_type="LS2000", is_available=True))
+    db.commit()
+    requests = [(product.id, None, None), (product.id, 36, None), (product.id, 30, "H")]
+    expected = [calculate_product_price(db, *request) for request in requests]
+    assert calculate_product_prices(db, requests) == expected
+
+def test_calculate_product_prices_unpriceable_entries_are_none(db):
+    product = make_product(db)
+    make_material(db)
+    make_material(db, code="H")
+    requests = [(product.id, None, None), (product.id, None, "H"), (999, None, None)]
+    assert calculate_product_prices(db, requests) == [product.base_price, None, None]
+
+def make_exotic_pair(db):
+    s_product = make_product(db, base_price=400.0, material="S")
+    h_product = make_product(db, base_price=0.0, material="H")
+    make_material(db, code="S")
+    make_material(db, code="U")
+    db.add(MaterialAvailability(material_code="U", product_type="LS2000", is_available=True))
+    db.commit()
+    return s_product, h_product
+
+def test_calculate_product_price_exotic_material_uses_s_base_price(db):
+    s_product, h_product = make_exotic_pair(db)
+    assert calculate_product_price(db, h_product.id, material_override="U") == s_product.base_price + 20.0
+
+def test_calculate_product_price_single_query(db):
+    s_product, h_product = make_exotic_pair(db)
+    calculate_product_price(db, s_product.id)  # Loads the reference data cache
+    h_product_id, expected = h_product.id, s_product.base_price + 20.0
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    try:
+        assert calculate_product_price(db, h_product_id, material_override="U") == expected
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+    assert len(statements) == 1
+
+def test_price_product_returns_product_in_single_query(db):
+    s_product, h_product = make_exotic_pair(db)
+    calculate_product_price(db, s_product.id)  # Loads the reference data cache
+    h_product_id, expected = h_product.id, s_product.base_price + 20.0
+    db.expunge_all()
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    try:
+        product, price = price_product(db, h_product_id, material_override="U")
+        assert (product.id, product.material, price) == (h_product_id, "H", expected)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+    assert len(statements) == 1
+
+def test_price_product_product_not_found(db):
+    with pytest.raises(ValueError, match="Product with ID 1 not found"):
+        price_product(db, 1)
+
+def test_calculate_option_prices_matches_scalar_pricing():
+    np = pytest.importorskip("numpy")
+    from src.core.pricing import calculate_option_prices, encode_option_price_types
+    price_types = ["fixed", "per_inch", "per_foot", "per_inch", "unknown"]
+    prices = [100.0, 10.0, 120.0, 10.0, 50.0]
+    lengths = [24, 24, 24, None, 24]
+    expected = [calculate_option_price(*args) for args in zip(prices, price_types, lengths)]
+    result = calculate_option_prices(
+        prices,
+        encode_option_price_types(price_types),
+        [np.nan if length is None else length for length in lengths]
+    )
+    assert result.tolist() == expected
+
+def test_material_rules_are_cached_until_materials_change(db):
+    product = make_product(db, base_length=24, material="S")
+    material = make_material(db, code="S", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=50.0)
+    assert calculate_product_price(db, product.id, length=24) == product.base_price + 50.0
+    # Writing a standard length through the ORM invalidates the cache
+    db.add(StandardLength(material_code="S", length=24.0))
+    db.commit()
+    assert calculate_product_price(db, product.id, length=24) == product.base_price
+    material.nonstandard_length_surcharge = 75.0
+    db.commit()
+    assert calculate_product_price(db, product.id, length=30) == product.base_price + (30-24)*3.75 + 75.0
+
+def test_calculate_product_price_rounds_to_cents(db):
+    product = make_product(db, base_price=100.0, base_length=24, material="H")
+    make_material(db, code="H")
+    # Float arithmetic gives 127.50999999999999 for 100 + 3 * 9.17
+    assert calculate_product_price(db, product.id, length=27) == 127.51
+
+def test_round_price_rounds_half_up():
+    assert round_price(2.675) == 2.68
+    assert round_price(Decimal("10.005")) == 10.01
+
+def test_calculate_product_prices_array_matches_batch_pricing(db):
+    np = pytest.importorskip("numpy")
+    from src.core.pricing import calculate_product_prices_array
+    s_product, h_product = make_exotic_pair(db)
+    make_material(db, code="H", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=300.0)
+    db.add(StandardLength(material_code="H", length=36.0))
+    db.commit()
+    requests = [
+        (s_product.id, None, None), (s_product.id, 30, None), (h_product.id, 27, None),
+        (h_product.id, 36, None), (h_product.id, None, "U"), (999, None, None),
+        (h_product.id, 24.5, None)
+    ]
+    expected = [np.nan if price is None else price for price in calculate_product_prices(db, requests)]
+    np.testing.assert_array_equal(calculate_product_prices_array(db, requests), expected)
+
+def test_material_availability_cache_follows_changes(db):
+    product = make_product(db)
+    make_material(db, code="S")
+    make_material(db, code="H")
+    availability = MaterialAvailability(material_code="H", product_type="LS2000", is_available=True)
+    db.add(availability)
+    db.commit()
+    assert calculate_product_price(db, product.id, material_override="H") == product.base_price
+    availability.is_available = False
+    db.commit()
+    with pytest.raises(ValueError, match="Material H is not available for product type LS2000"):
+        calculate_product_price(db, product.id, material_override="H")
+
+def test_calculate_product_prices_array_rounds_half_cents_up(db):
+    np = pytest.importorskip("numpy")
+    from src.core.pricing import calculate_product_prices_array
+    product = make_product(db, base_price=0.0, base_length=24, material="H")
+    make_material(db, code="H")
+    # Half an inch at $9.17/inch is 4.585: half up gives 4.59, half even 4.58
+    requests = [(product.id, 24.5, None)]
+    assert calculate_product_prices(db, requests) == [4.59]
+    np.testing.assert_array_equal(calculate_product_prices_array(db, requests), [4.59])
+
+def test_reference_data_dropped_after_core_update_commit(db):
+    product = make_product(db, base_length=24, material="S")
+    make_material(db, code="S", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=50.0)
+    assert calculate_product_price(db, product.id, length=30) == product.base_price + 6*3.75 + 50.0
+    # A bulk update fires no ORM flush events; the commit still drops the cache
+    db.execute(update(Material).where(Material.code == "S").values(nonstandard_length_surcharge=75.0))
+    db.commit()
+    assert calculate_product_price(db, product.id, length=30) == product.base_price + 6*3.75 + 75.0
+
+def test_reference_data_dropped_after_rollback(db):
+    product = make_product(db, base_length=24, material="S")
+    material = make_material(db, code="S", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=50.0)
+    material.nonstandard_length_surcharge = 75.0
+    db.flush()
+    assert calculate_product_price(db, product.id, length=30) == product.base_price + 6*3.75 + 75.0
+    db.rollback()
+    assert calculate_product_price(db, product.id, length=30) == product.base_price + 6*3.75 + 50.0
+
+def test_reference_data_cached_per_engine(db):
+    product = make_product(db, base_length=24, material="S")
+    make_material(db, code="S", has_nonstandard_length_surcharge=True, nonstandard_length_surcharge=50.0)
+    other_engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(other_engine)
+    other = sessionmaker(bind=other_engine)()
+    try:
+        other_product = make_product(other, base_length=24, material="S")
+        make_material(other, code="S")
+        assert calculate_product_price(db, product.id, length=30) == product.base_price + 6*3.75 + 50.0
+        assert calculate_product_price(other, other_product.id, length=30) == other_product.base_price + 6*3.75
+    finally:
+        other.close()
+        other_engine.dispose()
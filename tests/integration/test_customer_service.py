@@ -0,0 +1,11 @@
+from src.core.models.customer import Customer
+from src.core.services.customer_service import CustomerService
+
+
+def test_get_customers_paginated(db_session):
+    customers = [Customer(name=f"Customer {i}") for i in range(5)]
+    db_session.add_all(customers)
+    db_session.commit()
+    assert CustomerService.get_customers_paginated(db_session, limit=2) == customers[:2]
+    assert CustomerService.get_customers_paginated(db_session, limit=2, offset=4) == customers[4:]
+    assert CustomerService.get_customers_paginated(db_session, limit=2, offset=6) == []
@@ -0,0 +1,22 @@
+from sqlalchemy import event
+from src.core.models.customer import Customer
+from src.utils.db_utils import get_by_id
+
+
+def test_get_by_id_uses_identity_map(db_session):
+    customer = Customer(name="Jane Doe")
+    db_session.add(customer)
+    db_session.commit()
+    customer_id = customer.id
+    assert get_by_id(db_session, Customer, customer_id) is customer
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        assert get_by_id(db_session, Customer, customer_id) is customer
+        assert get_by_id(db_session, Customer, customer_id) is customer
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+    assert statements == []
+    assert get_by_id(db_session, Customer, 999) is None
@@ -0,0 +1,82 @@
+import pytest
+from src.core.models.option import Option
+from src.core.pricing import calculate_option_price
+
+
+@pytest.mark.parametrize("price_type", ["fixed", "per_inch", "per_foot"])
+@pytest.mark.parametrize("length", [None, 24])
+def test_option_calculate_price_matches_calculate_option_price(price_type, length):
+    option = Option(name="Test Option", price=120.0, price_type=price_type)
+    assert option.calculate_price(length) == calculate_option_price(120.0, price_type, length)
+
+def test_option_price_function_resolved_on_load(db_session):
+    db_session.add(Option(name="Per Foot Option", price=120.0, price_type="per_foot"))
+    db_session.commit()
+    db_session.expunge_all()
+    option = db_session.query(Option).filter_by(name="Per Foot Option").one()
+    assert option.calculate_price(24) == 240.0
+    option.price_type = "per_inch"
+    assert option.calculate_price(24) == 2880.0
+
+def test_option_invalid_price_type_rejected():
+    with pytest.raises(ValueError, match="Invalid price type: unknown"):
+        Option(name="Bad Option", price=10.0, price_type="unknown")
+
+def test_option_price_type_check_constraint(db_session):
+    from sqlalchemy import text
+    from sqlalchemy.exc import IntegrityError
+    with pytest.raises(IntegrityError):
+        db_session.execute(text("INSERT INTO options (name, price, price_type) VALUES ('Raw', 1.0, 'per_yard')"))
+
+def test_option_without_price_type_is_fixed():
+    assert Option(name="Default Option", price=50.0).calculate_price(24) == 50.0
+
+def test_option_product_families_sets_family_rows(db_session):
+    option = Option(name="Family Option", price=40.0, product_families="LS2000, LS6000,,LS2000")
+    db_session.add(option)
+    db_session.commit()
+    assert sorted(family.product_family for family in option.families) == ["LS2000", "LS6000"]
+    option.product_families = "LS7000/2"
+    db_session.commit()
+    assert [family.product_family for family in option.families] == ["LS7000/2"]
+
+def test_get_product_options_filters_by_product_family(db_session):
+    from src.core.models.product import Product
+    from src.core.services.product_service import ProductService
+    product = Product(model_number="LS6000", base_price=100.0, base_length=10, material="S", voltage="115VAC")
+    db_session.add_all([
+        product,
+        Option(name="LS2000 Only", price=10.0, product_families="LS2000", excluded_products=""),
+        Option(name="LS6000 Too", price=10.0, product_families="LS2000,LS6000", excluded_products=""),
+        Option(name="Any Family", price=10.0, excluded_products=""),
+    ])
+    db_session.commit()
+    options = ProductService.get_product_options(db_session, product_id=product.id)
+    assert sorted(option.name for option in options) == ["Any Family", "LS6000 Too"]
+
+def test_get_product_options_excludes_by_exact_model_number(db_session):
+    from src.core.models.product import Product
+    from src.core.services.product_service import ProductService
+    product = Product(model_number="LS2000", base_price=100.0, base_length=10, material="S", voltage="115VAC")
+    excluded = Option(name="Not LS2000", price=10.0, excluded_products="LS6000, LS2000")
+    db_session.add_all([
+        product,
+        excluded,
+        Option(name="Not LS2", price=10.0, excluded_products="LS2"),
+        Option(name="No Exclusions", price=10.0),
+    ])
+    db_session.commit()
+    assert sorted(row.model_number for row in excluded.exclusions) == ["LS2000", "LS6000"]
+    options = ProductService.get_product_options(db_session, product_id=product.id)
+    assert sorted(option.name for option in options) == ["No Exclusions", "Not LS2"]
+
+def test_option_with_unknown_price_type_loads_as_fixed(db_session):
+    from sqlalchemy import text
+    # Rows written before the price type constraint may hold legacy values
+    db_session.execute(text("PRAGMA ignore_check_constraints = ON"))
+    try:
+        db_session.execute(text("INSERT INTO options (name, price, price_type) VALUES ('Legacy', 10.0, 'per_yard')"))
+    finally:
+        db_session.execute(text("PRAGMA ignore_check_constraints = OFF"))
+    option = db_session.query(Option).filter_by(name="Legacy").one()
+    assert option.calculate_price(24) == calculate_option_price(10.0, "per_yard", 24) == 10.0
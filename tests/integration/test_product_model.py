@@ -27,4 +27,14 @@ def test_delete_product(db_session):
     db_session.delete(product)
     db_session.commit()
     deleted = db_session.query(Product).filter_by(model_number="LS2002").first()
-    assert deleted is None 
\ No newline at end of file
+    assert deleted is None
+
+
+def test_product_type_key_follows_model_number(db_session):
+    product = Product(model_number="LS7000/2-115VAC-S-10", base_price=100.0, base_length=10, material="S", voltage="115VAC")
+    db_session.add(product)
+    db_session.commit()
+    assert product.product_type_key == "LS7000/2"
+    product.model_number = "LS8000-115VAC-S-10"
+    db_session.commit()
+    assert product.product_type_key == "LS8000"
@@ -0,0 +1,93 @@
+import pytest
+from src.core.models.material import Material
+from src.core.models.material_option import MaterialOption
+from src.core.models.product import Product
+from src.core.models.voltage_option import VoltageOption
+from src.core.pricing import clear_reference_data_cache
+from src.core.services.product_service import ProductService, clear_family_options_cache
+
+
+@pytest.fixture(autouse=True)
+def family_options_cache():
+    clear_family_options_cache()
+    yield
+    clear_family_options_cache()
+
+@pytest.fixture
+def products(db_session):
+    clear_reference_data_cache()
+    short = Product(model_number="LS2000", base_price=100.0, base_length=10, material="S", voltage="115VAC")
+    long = Product(model_number="LS6000", base_price=200.0, base_length=10, material="S", voltage="115VAC")
+    db_session.add_all([short, long, Material(code="S", name="316 Stainless Steel", base_length=10.0)])
+    db_session.commit()
+    yield short, long
+    clear_reference_data_cache()
+
+def test_configure_products_matches_configure_product(db_session, products):
+    short, long = products
+    configurations = [(short.id, None, None), (long.id, 20.0, None), (short.id, 12.0, None)]
+    results = ProductService.configure_products(db_session, configurations)
+    assert results == [ProductService.configure_product(db_session, *configuration) for configuration in configurations]
+
+def test_configure_products_unpriceable_configuration(db_session, products):
+    short, _ = products
+    results = ProductService.configure_products(db_session, [(short.id, None, "H")])
+    assert results == [(short, None)]
+
+def test_configure_products_missing_product(db_session, products):
+    with pytest.raises(ValueError, match="Product with ID 999 not found"):
+        ProductService.configure_products(db_session, [(999, None, None)])
+
+def test_get_available_materials_for_product(db_session):
+    db_session.add_all([
+        MaterialOption(product_family="LS2000", material_code="S", display_name="S - 316 Stainless Steel", base_price=0.0),
+        MaterialOption(product_family="LS2000", material_code="H", display_name="H - Halar Coated", base_price=110.0, is_available=0),
+        MaterialOption(product_family="LS6000", material_code="U", display_name="U - UHMWPE", base_price=20.0),
+    ])
+    db_session.commit()
+    assert ProductService.get_available_materials_for_product(db_session, "LS2000") == [
+        {'code': "S", 'display_name': "S - 316 Stainless Steel", 'base_price': 0.0}
+    ]
+
+def test_get_available_voltages(db_session):
+    db_session.add_all([
+        VoltageOption(product_family="LS2000", voltage="115VAC"),
+        VoltageOption(product_family="LS2000", voltage="24VDC", is_available=0),
+        VoltageOption(product_family="LS6000", voltage="230VAC"),
+    ])
+    db_session.commit()
+    assert ProductService.get_available_voltages(db_session, "LS2000") == ["115VAC"]
+
+def test_get_products_paginated(db_session, products):
+    short, long = products
+    assert ProductService.get_products(db_session, material="S", limit=1) == [short]
+    assert ProductService.get_products(db_session, material="S", limit=1, offset=1) == [long]
+
+def test_get_available_voltages_cached_until_option_written(db_session):
+    from sqlalchemy import event
+    db_session.add(VoltageOption(product_family="LS2000", voltage="115VAC"))
+    db_session.commit()
+    assert ProductService.get_available_voltages(db_session, "LS2000") == ["115VAC"]
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        assert ProductService.get_available_voltages(db_session, "LS2000") == ["115VAC"]
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+    assert statements == []
+
+    db_session.add(VoltageOption(product_family="LS2000", voltage="24VDC"))
+    db_session.commit()
+    assert ProductService.get_available_voltages(db_session, "LS2000") == ["115VAC", "24VDC"]
+
+def test_get_available_voltages_dropped_after_core_update_commit(db_session):
+    from sqlalchemy import update
+    db_session.add(VoltageOption(product_family="LS2000", voltage="115VAC"))
+    db_session.commit()
+    assert ProductService.get_available_voltages(db_session, "LS2000") == ["115VAC"]
+
+    db_session.execute(update(VoltageOption).values(voltage="24VDC"))
+    db_session.commit()
+    assert ProductService.get_available_voltages(db_session, "LS2000") == ["24VDC"]
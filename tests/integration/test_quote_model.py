@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import event
+from src.core.models.option import QuoteItemOption
+from src.core.models.quote import Quote, QuoteItem
+
+
+def make_quote(db_session, quote_number, items):
+    quote = Quote(quote_number=quote_number, customer_id=1)
+    for unit_price, quantity, discount_percent, options in items:
+        item = QuoteItem(product_id=1, unit_price=unit_price, quantity=quantity, discount_percent=discount_percent)
+        item.options = [QuoteItemOption(option_id=1, price=price, quantity=qty) for price, qty in options]
+        quote.items.append(item)
+    db_session.add(quote)
+    db_session.commit()
+    return quote
+
+def test_quote_total(db_session):
+    quote = make_quote(db_session, "Q-T-001", [(100.0, 2, 10.0, [(25.0, 2)]), (50.0, 1, 0.0, [])])
+    # (100*2 + 25*2) * 0.9 + 50
+    assert quote.total == pytest.approx(275.0)
+
+def test_compute_totals_matches_total_property(db_session):
+    first = make_quote(db_session, "Q-T-002", [(100.0, 2, 10.0, [(25.0, 2), (5.0, 1)]), (50.0, 3, 0.0, [])])
+    second = make_quote(db_session, "Q-T-003", [(80.0, 1, 50.0, [(10.0, 4)])])
+    empty = make_quote(db_session, "Q-T-004", [])
+    totals = Quote.compute_totals(db_session, [first.id, second.id, empty.id])
+    assert totals[first.id] == pytest.approx(first.total)
+    assert totals[second.id] == pytest.approx(second.total)
+    assert totals[empty.id] == 0.0
+
+def test_compute_totals_no_ids(db_session):
+    assert Quote.compute_totals(db_session, []) == {}
+
+def test_quote_total_loads_items_and_options_in_bulk(db_session):
+    make_quote(db_session, "Q-T-005", [(100.0, 1, 0.0, [(25.0, 1), (5.0, 2)]) for _ in range(5)])
+    db_session.expunge_all()
+    statements = []
+    engine = db_session.get_bind().engine
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        quote = db_session.query(Quote).filter_by(quote_number="Q-T-005").one()
+        assert quote.total == pytest.approx(5 * 135.0)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    # Quote, then one query for all items and one for all of their options
+    assert len(statements) == 3
+
+def test_quote_item_totals_in_sql(db_session):
+    quote = make_quote(db_session, "Q-T-006", [(100.0, 2, 10.0, [(25.0, 2)]), (50.0, 1, 0.0, []), (400.0, 1, 50.0, [(10.0, 1)])])
+    rows = (
+        db_session.query(QuoteItem.id, QuoteItem.subtotal, QuoteItem.discount_amount, QuoteItem.total)
+        .filter(QuoteItem.quote_id == quote.id)
+        .order_by(QuoteItem.id)
+        .all()
+    )
+    expected = [(item.id, item.subtotal, item.discount_amount, item.total) for item in sorted(quote.items, key=lambda item: item.id)]
+    for row, expected_row in zip(rows, expected):
+        assert tuple(row) == pytest.approx(expected_row)
+    large_items = db_session.query(QuoteItem).filter(QuoteItem.quote_id == quote.id, QuoteItem.total > 200).all()
+    assert sorted(item.total for item in large_items) == [205.0, 225.0]
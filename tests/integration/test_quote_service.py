@@ -0,0 +1,42 @@
+from sqlalchemy import event
+from src.core.models.customer import Customer
+from src.core.models.option import Option, QuoteItemOption
+from src.core.models.product_variant import ProductFamily, ProductVariant
+from src.core.models.quote import Quote, QuoteItem
+from src.core.services.quote_service import QuoteService
+
+
+def test_get_quote_loads_lines_in_bulk(db_session):
+    family = ProductFamily(name="LS2000")
+    customer = Customer(name="Jane Doe")
+    quote = Quote(quote_number="Q-S-001", customer=customer)
+    for i in range(3):
+        variant = ProductVariant(product_family=family, model_number=f"LS2000-115VAC-S-{10 + i}", base_price=100.0)
+        item = QuoteItem(product=variant, unit_price=100.0, quantity=1)
+        item.options = [QuoteItemOption(option=Option(name=f"Option {i}", price=5.0), price=5.0)]
+        quote.items.append(item)
+    db_session.add(quote)
+    db_session.commit()
+    quote_id = quote.id
+    db_session.expunge_all()
+
+    statements = []
+    engine = db_session.get_bind().engine
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        quote = QuoteService.get_quote(db_session, quote_id)
+        lines = [
+            (item.product.model_number, [option.option.name for option in item.options])
+            for item in quote.items
+        ]
+        assert quote.customer.name == "Jane Doe"
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert sorted(lines) == [(f"LS2000-115VAC-S-{10 + i}", [f"Option {i}"]) for i in range(3)]
+    # Quote with customer, then items, their variants, their options, the options'
+    # records and those records' families and exclusions: one query each, not per line
+    assert len(statements) == 7
+
+def test_get_quote_not_found(db_session):
+    assert QuoteService.get_quote(db_session, 999) is None
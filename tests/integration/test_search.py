@@ -0,0 +1,71 @@
+from src.core.models.customer import Customer
+from src.core.models.product import Product
+from src.core.services.customer_service import CustomerService
+from src.core.services.product_service import ProductService
+
+
+def test_search_customers_matches_substrings(db_session):
+    acme = Customer(name="Jane Doe", company="Acme Industries", email="jane@acme.com")
+    other = Customer(name="John Smith", company="Globex", email=None)
+    db_session.add_all([acme, other])
+    db_session.commit()
+
+    assert CustomerService.search_customers(db_session, "CME IND") == [acme]
+    assert CustomerService.search_customer_summaries(db_session, "CME IND") == [(acme.id, "Jane Doe", "Acme Industries", "jane@acme.com")]
+    assert [match.id for match in CustomerService.search_customers(db_session, "smit")] == [other.id]
+    # Two-character terms are shorter than a trigram and fall back to ILIKE
+    assert [match.id for match in CustomerService.search_customers(db_session, "do")] == [acme.id]
+
+def test_search_customers_follows_updates_and_deletes(db_session):
+    customer = Customer(name="Jane Doe", company="Acme Industries")
+    db_session.add(customer)
+    db_session.commit()
+
+    customer.company = "Initech"
+    db_session.commit()
+    assert CustomerService.search_customers(db_session, "acme") == []
+    assert [match.id for match in CustomerService.search_customers(db_session, "initech")] == [customer.id]
+
+    db_session.delete(customer)
+    db_session.commit()
+    assert CustomerService.search_customers(db_session, "initech") == []
+
+def test_search_products_matches_model_and_description(db_session):
+    switch = Product(model_number="LS2000", description="Level switch with \"quoted\" text", base_price=100.0)
+    probe = Product(model_number="LS7000/2", description="Dual point probe", base_price=200.0)
+    db_session.add_all([switch, probe])
+    db_session.commit()
+
+    assert ProductService.search_products(db_session, "7000/2") == [probe]
+    assert ProductService.search_product_summaries(db_session, "7000/2") == [(probe.id, "LS7000/2", "Dual point probe")]
+    assert [match.model_number for match in ProductService.search_products(db_session, "level switch")] == ["LS2000"]
+    assert [match.id for match in ProductService.search_products(db_session, '"quoted"')] == [switch.id]
+
+def test_search_customers_skips_short_terms_and_escapes_wildcards(db_session):
+    discount = Customer(name="Jane Doe", company="100% Pumps")
+    other = Customer(name="John Smith", company="Globex")
+    db_session.add_all([discount, other])
+    db_session.commit()
+
+    assert CustomerService.search_customers(db_session, " j ") == []
+    assert CustomerService.search_customers(db_session, None) == []
+    assert [match.id for match in CustomerService.search_customers(db_session, "0%")] == [discount.id]
+    assert [match.id for match in CustomerService.search_customers(db_session, "  globex  ")] == [other.id]
+
+def test_search_falls_back_without_trigram_support(monkeypatch):
+    from sqlalchemy import create_engine, inspect
+    from sqlalchemy.orm import sessionmaker
+    from src.core.database import Base
+    monkeypatch.setattr("src.core.search.fts_trigram_supported", lambda connection: False)
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        assert "customer_fts" not in inspect(engine).get_table_names()
+        acme = Customer(name="Jane Doe", company="Acme Industries", email="jane@acme.com")
+        session.add(acme)
+        session.commit()
+        assert [match.id for match in CustomerService.search_customers(session, "acme ind")] == [acme.id]
+    finally:
+        session.close()
+        engine.dispose()
@@ -0,0 +1,26 @@
+"""
+Tests for the product selection tab
+"""
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.ui.product_tab import ProductTab
+
+
+@pytest.fixture
+def app():
+    """Fixture providing a QApplication instance"""
+    return QApplication.instance() or QApplication([])
+
+
+def test_product_selected_only_on_change(app):
+    """Test that product_selected is not repeated for the same model"""
+    tab = ProductTab()
+    selected = []
+    tab.product_selected.connect(selected.append)
+
+    tab.product_model.setCurrentIndex(1)
+    tab.on_model_changed(1)
+    tab.product_model.setCurrentIndex(2)
+
+    assert selected == ["LS2100", "LS6000"]
@@ -0,0 +1,151 @@
+"""
+Tests for the quote tab
+"""
+import pytest
+from PySide6.QtCore import QEventLoop, Qt, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.ui.quote_tab import OPTION_PRICERS, QuoteTab, SpecsTableModel
+
+
+@pytest.fixture
+def app():
+    """Fixture providing a QApplication instance"""
+    return QApplication.instance() or QApplication([])
+
+
+def test_specs_model_rows(app):
+    """Test that header and spec rows are displayed and styled"""
+    model = SpecsTableModel()
+    model.set_rows([
+        (True, "Dimensions", ""),
+        (False, "Probe Length", "12"),
+    ])
+
+    assert model.rowCount() == 2
+    assert model.columnCount() == 2
+    assert model.headerData(0, Qt.Horizontal) == "Configuration Item"
+
+    header, spec = model.index(0, 0), model.index(1, 0)
+    assert model.data(header) == "Dimensions"
+    assert model.data(model.index(0, 1)) is None
+    assert model.data(header, Qt.FontRole).bold()
+    assert model.data(header, Qt.BackgroundRole) is not None
+
+    assert model.data(header, Qt.UserRole) is True
+    assert model.data(spec) == "Probe Length"
+    assert model.data(spec, Qt.UserRole) is False
+    assert model.data(model.index(1, 1)) == "12"
+    assert not model.data(spec, Qt.FontRole).bold()
+    assert model.data(spec, Qt.BackgroundRole) is None
+
+
+def test_specs_model_reset(app):
+    """Test that setting rows replaces the previous contents"""
+    model = SpecsTableModel()
+    model.set_rows([(True, "Housing", ""), (False, "Housing", "Cast")])
+    model.set_rows([])
+
+    assert model.rowCount() == 0
+
+
+def test_customer_updates_are_debounced(app):
+    """Test that a burst of customer edits emits customer_updated once"""
+    tab = QuoteTab()
+    emitted = []
+    tab.customer_updated.connect(emitted.append)
+
+    for text in ("A", "Ac", "Acme"):
+        tab.customer_name.setText(text)
+    app.processEvents()
+    assert emitted == []
+
+    loop = QEventLoop()
+    QTimer.singleShot(tab.CUSTOMER_UPDATE_DELAY_MS + 100, loop.quit)
+    loop.exec()
+
+    assert len(emitted) == 1
+    assert emitted[0]["name"] == "Acme"
+
+
+def test_customer_info_is_cached_until_edited(app):
+    """Test that customer info is reused until a field changes"""
+    tab = QuoteTab()
+    tab.email.setText("sales@example.com")
+
+    info = tab.get_customer_info()
+    assert info["email"] == "sales@example.com"
+    assert tab.get_customer_info() is info
+
+    tab.notes.setPlainText("Rush order")
+    info = tab.get_customer_info()
+    assert info["notes"] == "Rush order"
+    assert tab.get_quote_data()["customer"] is info
+
+
+@pytest.mark.parametrize("name, value, base_model, expected", [
+    ("material", "H - Hastelloy C", "LS2000", 400.0),
+    ("material", "S - 316 Stainless Steel", "LS2000", 0.0),
+    ("exotic_metals", "U - Monel", "LS2000", 500.0),
+    ("exotic_metals", "None", "LS2000", 0.0),
+    ("oring", "PTFE", "LS2000", 80.0),
+    ("housing", "Explosion-Proof", "LS2000", 300.0),
+    ("housing", "Standard", "LS2000", 0.0),
+    ("high_temp", True, "LS2000", 150.0),
+    ("high_temp", False, "LS2000", 0.0),
+    ("probe_length", 12, "LS2000", 16.0),
+    ("probe_length", 12, "LS6000", 24.0),
+    ("cable_length", 15, "LS2000", 25.0),
+])
+def test_option_pricers(name, value, base_model, expected):
+    """Test the placeholder option prices used by the quote tab"""
+    assert OPTION_PRICERS[name](value, base_model) == expected
+
+
+def test_pricing_skipped_when_unchanged(app, monkeypatch):
+    """Test that pricing is only recalculated when its inputs change"""
+    tab = QuoteTab()
+    calls = []
+    monkeypatch.setattr("src.ui.quote_tab.SessionLocal", lambda: calls.append(1) or _NoSession())
+
+    tab.update_product_info({"model": "LS2000 General Purpose"})
+    tab.update_product_info({"model": "LS2000 General Purpose"})
+    assert len(calls) == 1
+    assert tab.pricing["base_price"] == 800.0
+
+    tab.update_specifications({"high_temp": True, "tags": ["a"]})
+    tab.update_specifications({"high_temp": True, "tags": ["a"]})
+    assert len(calls) == 2
+    assert tab.pricing["options_price"] == 150.0
+
+
+class _NoSession:
+    """Stand-in session for pricing without connection options"""
+
+    def close(self):
+        pass
+
+
+def test_specifications_grouped_by_category(app, monkeypatch):
+    """Test that specs are listed under their categories in display order"""
+    monkeypatch.setattr("src.ui.quote_tab.SessionLocal", _NoSession)
+    tab = QuoteTab()
+    tab.update_specifications({
+        "high_temp": True,
+        "probe_length": 12,
+        "unknown_spec": "ignored",
+        "material": "316 SS",
+        "voltage": "24VDC",
+    })
+
+    assert tab.specs_model.rows == [
+        (True, "Essential Properties", ""),
+        (False, "Voltage", "24VDC"),
+        (False, "Material", "316 SS"),
+        (True, "Dimensions", ""),
+        (False, "Probe Length", "12"),
+        (True, "Additional Features", ""),
+        (False, "High Temp", "Yes"),
+    ]
+    assert tab.specs_table.columnSpan(0, 0) == 2
+    assert tab.specs_table.columnSpan(1, 0) == 1
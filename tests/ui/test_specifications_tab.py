@@ -0,0 +1,188 @@
+"""
+Tests for the specifications tab
+"""
+import pytest
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication, QFormLayout
+
+from src.ui.specifications_tab import SpecificationsTab
+
+
+@pytest.fixture
+def app():
+    """Fixture providing a QApplication instance"""
+    return QApplication.instance() or QApplication([])
+
+
+class _FakeSession:
+    """Stand-in session; the fake product service does not query it"""
+
+    def close(self):
+        pass
+
+
+class _FakeProductService:
+    """Product service returning fixed voltages and materials"""
+
+    def get_available_voltages(self, db, product_family):
+        return ["24VDC", "115VAC"]
+
+    def get_available_materials_for_product(self, db, product_family):
+        return [{"display_name": "S - 316 Stainless Steel"}]
+
+
+@pytest.fixture
+def tab(app, monkeypatch):
+    """Fixture providing a specifications tab without database access"""
+    monkeypatch.setattr("src.ui.specifications_tab.SessionLocal", _FakeSession)
+    tab = SpecificationsTab()
+    tab.product_service = _FakeProductService()
+    return tab
+
+
+def _show_product(app, tab, category, model):
+    """Show a product's form and let the deferred sections mount"""
+    tab.update_for_product(category, model)
+    for _ in tab.SECTIONS:
+        app.processEvents()
+
+
+def _section_titles(tab):
+    """Titles of the sections currently on the form, in order"""
+    titles = []
+    for row in range(tab.specs_layout.rowCount()):
+        item = tab.specs_layout.itemAt(row, QFormLayout.SpanningRole)
+        if item is not None and item.widget().objectName() == "section_header":
+            titles.append(item.widget().text())
+    return titles
+
+
+def test_sections_for_category(app, tab):
+    """Test that the form shows the sections for the product category"""
+    _show_product(app, tab, "Level Transmitter", "LT9000")
+
+    specs = tab.get_specifications()
+    assert specs["voltage"] == "24VDC"
+    assert "remote_display" in specs
+    assert "extended_probe" not in specs
+
+    _show_product(app, tab, "Emissions", "LS2000")
+    assert "Probe Length" not in _section_titles(tab)
+    assert "O-ring Material" not in _section_titles(tab)
+    assert "probe_length" not in tab.get_specifications()
+
+
+def test_sections_reused_with_defaults(app, tab):
+    """Test that sections are reused across products and reset to defaults"""
+    emitted = []
+    tab.specs_updated.connect(emitted.append)
+
+    _show_product(app, tab, "Level Switch", "LS2000")
+    housing = tab.specs_widgets["housing"]
+    housing.setCurrentIndex(2)
+    tab.specs_widgets["probe_length"].setValue(40)
+    emitted.clear()
+
+    _show_product(app, tab, "Level Transmitter", "LT9000")
+    assert tab.specs_widgets["housing"] is housing
+    assert tab.get_specifications()["housing"] == "Standard"
+    assert tab.get_specifications()["probe_length"] == 12
+    assert emitted == []
+
+    assert _section_titles(tab) == [
+        "Voltage", "Material", "Probe Length", "Connection", "Exotic Metals",
+        "O-ring Material", "Cable Length", "Housing Type", "Additional Options",
+    ]
+
+
+def test_specs_updates_are_debounced(app, tab):
+    """Test that a burst of widget changes emits specs_updated once"""
+    emitted = []
+    tab.specs_updated.connect(emitted.append)
+    _show_product(app, tab, "Level Switch", "LS2000")
+
+    for length in (20, 21, 22):
+        tab.specs_widgets["probe_length"].setValue(length)
+    app.processEvents()
+    assert emitted == []
+
+    loop = QEventLoop()
+    QTimer.singleShot(tab.SPECS_UPDATE_DELAY_MS + 100, loop.quit)
+    loop.exec()
+
+    assert len(emitted) == 1
+    assert emitted[0]["probe_length"] == 22
+
+
+def test_take_pending_specs(app, tab):
+    """Test that a pending emission can be taken and applied immediately"""
+    emitted = []
+    tab.specs_updated.connect(emitted.append)
+    _show_product(app, tab, "Level Switch", "LS2000")
+    assert tab.take_pending_specs() is None
+
+    tab.specs_widgets["high_temp"].setChecked(True)
+    specs = tab.take_pending_specs()
+    assert specs["high_temp"] is True
+    assert tab.take_pending_specs() is None
+
+
+def test_specifications_follow_shown_widgets(app, tab):
+    """Test that only widgets on the form update the specifications"""
+    _show_product(app, tab, "Level Switch", "LS2000")
+    extended_probe = tab.specs_widgets["extended_probe"]
+    extended_probe.setChecked(True)
+    assert tab.get_specifications()["extended_probe"] is True
+
+    _show_product(app, tab, "Level Transmitter", "LT9000")
+    extended_probe.setChecked(False)
+    assert "extended_probe" not in tab.get_specifications()
+
+
+def test_sections_below_the_fold_mount_later(app, tab):
+    """Test that unbuilt sections after the first few are mounted in order"""
+    tab.update_for_product("Level Switch", "LS2000")
+    assert _section_titles(tab) == ["Voltage", "Material", "Probe Length"]
+
+    # Reading the specs mounts the rest immediately
+    assert "housing" in tab.get_specifications()
+    assert _section_titles(tab)[-2:] == ["Housing Type", "Additional Options"]
+
+
+def test_connection_fields_follow_connection_type(app, tab):
+    """Test that only the size fields for the connection type are shown"""
+    _show_product(app, tab, "Level Switch", "LS2000")
+    widgets = tab.specs_widgets
+
+    assert not widgets["npt_size"].isHidden()
+    assert widgets["flange_size"].isHidden()
+
+    widgets["connection_type"].setCurrentText("Flange")
+    assert widgets["npt_size"].isHidden()
+    assert not widgets["flange_rating"].isHidden()
+    assert not widgets["flange_size"].isHidden()
+    assert widgets["triclamp_size"].isHidden()
+
+    _show_product(app, tab, "Level Transmitter", "LT9000")
+    assert tab.specs_widgets["connection_type"].currentText() == "NPT"
+    assert not widgets["npt_size"].isHidden()
+    assert widgets["flange_size"].isHidden()
+
+
+def test_unchanged_specs_not_emitted(app, tab):
+    """Test that specs_updated is skipped when the specs did not change"""
+    emitted = []
+    tab.specs_updated.connect(emitted.append)
+    _show_product(app, tab, "Level Switch", "LS2000")
+    high_temp = tab.specs_widgets["high_temp"]
+
+    for checked in (True, False, True):
+        high_temp.setChecked(checked)
+        loop = QEventLoop()
+        QTimer.singleShot(tab.SPECS_UPDATE_DELAY_MS + 100, loop.quit)
+        loop.exec()
+    assert [specs["high_temp"] for specs in emitted] == [True, False, True]
+
+    high_temp.setChecked(False)
+    high_temp.setChecked(True)
+    assert tab.take_pending_specs() is None